@@ -11,18 +11,71 @@ Date: 2025-08-09
 import pandas as pd
 import os
 import sys
+import io
+import json
+import hashlib
 from pathlib import Path
 import numpy as np
 from datetime import datetime
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = pa_csv = None
+
+# Repository copy of the Yardi extract; override with YARDI_DATA_PATH or --data-path
+DEFAULT_DATA_PATH = Path(__file__).resolve().parents[2] / "Data" / "Yardi_Tables"
+# Baseline metric cache, kept out of the data directory; override with YARDI_CACHE_DIR or --cache-dir
+DEFAULT_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / ".cache") / "yardi-powerbi"
+
 class YardiDataModelValidator:
-    def __init__(self, data_path):
+    # Tables read by the structure, amendment, orphan and rent charge phases, in order of first use,
+    # with the only columns those phases touch (compared without case, spaces or underscores)
+    PHASE_TABLES = {
+        'dim_property': {'propertyid'},
+        'dim_fp_amendmentsunitspropertytenant': {
+            'amendmenthmy', 'propertyhmy', 'tenanthmy', 'amendmentsequence', 'amendmentstatus'
+        },
+        'dim_fp_amendmentchargeschedule': {'amendmenthmy'},
+        'fact_total': {'propertyid', 'accountid'},
+        'fact_occupancyrentarea': {'propertyid'},
+        'dim_account': {'accountid'}
+    }
+    
+    # Phases that can be skipped on re-runs: method -> (results/issue key, input tables)
+    INCREMENTAL_PHASES = {
+        'analyze_table_structures': ('table_structures', (
+            'dim_property', 'dim_fp_amendmentsunitspropertytenant', 'dim_fp_amendmentchargeschedule',
+            'fact_total', 'fact_occupancyrentarea'
+        )),
+        'validate_amendment_duplicates': ('amendment_duplicates', ('dim_fp_amendmentsunitspropertytenant',)),
+        'find_orphaned_records': ('orphaned_records', ('fact_total', 'dim_property', 'dim_account')),
+        'validate_amendment_rent_charges': ('amendment_rent_charges', (
+            'dim_fp_amendmentsunitspropertytenant', 'dim_fp_amendmentchargeschedule'
+        ))
+    }
+    
+    # Low-cardinality text columns held as categoricals so status filters compare int codes
+    CATEGORY_COLUMNS = frozenset({'amendment status', 'amendment type'})
+    
+    def __init__(self, data_path, cache_dir=None, sort_output=True):
         self.data_path = Path(data_path)
+        self.sort_output = sort_output
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
         self.results = {}
         self.issues = []
+        self.issue_counts = Counter()
+        self.phase_state = {}
         self.metrics = {}
+        self._table_cache = {}
+        self._pending_tables = {}
+        self._executor = None
+        self._file_index = None
         
         # Expected 32 tables from Phase1 validation script
         self.expected_tables = {
@@ -44,6 +97,125 @@ class YardiDataModelValidator:
             'ref_book_override_logic', 'control_active_scenario'
         }
         
+    def _csv_index(self):
+        """Map table name to CSV path, globbing the data directory once per run"""
+        if self._file_index is None:
+            self._file_index = {f.stem: f for f in self.data_path.glob("*.csv")}
+        return self._file_index
+    
+    def _has_table(self, table_name):
+        return table_name in self._csv_index()
+    
+    def _read_table(self, table_name):
+        """Read a table CSV with normalized column names, parsing only phase columns"""
+        csv_path = self.data_path / f"{table_name}.csv"
+        usecols = None
+        
+        wanted = self.PHASE_TABLES.get(table_name)
+        if wanted:
+            header = pd.read_csv(csv_path, nrows=0).columns
+            usecols = [
+                col for col in header
+                if col.lower().strip().replace('_', '').replace(' ', '') in wanted
+            ] or [header[0]]
+        
+        df = pd.read_csv(csv_path, usecols=usecols)
+        df.columns = df.columns.str.lower().str.strip()
+        if wanted:
+            # Phase columns are integer keys; the smallest fitting width cuts bytes scanned
+            for col in df.select_dtypes('integer').columns:
+                df[col] = pd.to_numeric(df[col], downcast='integer')
+        for col in self.CATEGORY_COLUMNS.intersection(df.columns):
+            df[col] = df[col].astype('category')
+        return df
+    
+    def _load_table(self, table_name):
+        """Read a table once and reuse it across validation phases"""
+        if table_name not in self._table_cache:
+            future = self._pending_tables.pop(table_name, None)
+            self._table_cache[table_name] = future.result() if future else self._read_table(table_name)
+        return self._table_cache[table_name]
+    
+    def prefetch_tables(self, table_names=PHASE_TABLES):
+        """Start background reads of the given tables; _load_table waits on them"""
+        pending = [
+            name for name in table_names
+            if name not in self._table_cache and name not in self._pending_tables
+            and self._has_table(name)
+        ]
+        if not pending:
+            return
+        
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+        for name in pending:
+            self._pending_tables[name] = self._executor.submit(self._read_table, name)
+    
+    def _release_tables(self):
+        """Drop cached tables and stop any prefetches that were never consumed"""
+        for future in self._pending_tables.values():
+            future.cancel()
+        self._pending_tables.clear()
+        self._table_cache.clear()
+        self._file_index = None
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+    
+    def _count_table(self, csv_file):
+        """Return (record_count, column_count) without materializing the full table"""
+        header = pd.read_csv(csv_file, nrows=0).columns
+        column_count = len(header)
+        
+        cached = self._table_cache.get(csv_file.stem)
+        if cached is not None:
+            return len(cached), column_count
+        
+        if pa_csv is not None:
+            # Count rows on the Arrow table directly; no pandas conversion needed. The one
+            # column read stays text so values that change type deep in the file cannot fail
+            try:
+                table = pa_csv.read_csv(
+                    csv_file,
+                    parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                    convert_options=pa_csv.ConvertOptions(
+                        include_columns=[header[0]], column_types={header[0]: pa.string()}
+                    )
+                )
+                return table.num_rows, column_count
+            except pa.ArrowInvalid:
+                pass  # Rows Arrow cannot parse; the pandas path below is more lenient
+        
+        record_count = len(pd.read_csv(csv_file, usecols=[0]))
+        return record_count, column_count
+    
+    def _record_issue(self, category, message):
+        """Record an issue and count it under the validation phase that raised it"""
+        self.issues.append(message)
+        self.issue_counts[category] += 1
+    
+    def _ordered(self, items):
+        """Sort report listings unless output sorting is disabled"""
+        return sorted(items) if self.sort_output else list(items)
+    
+    @staticmethod
+    def _composite_key(frame, columns):
+        """Pack key columns into one collision-free int64 key (-1 where any part is missing)"""
+        key = np.zeros(len(frame), dtype=np.int64)
+        missing = np.zeros(len(frame), dtype=bool)
+        for col in columns:
+            codes, uniques = pd.factorize(frame[col])
+            missing |= codes < 0
+            key = key * max(len(uniques), 1) + codes
+        key[missing] = -1
+        return key
+    
+    @staticmethod
+    def _count_orphans(fact_keys, dim_keys):
+        """Count fact keys with no match in the dimension keys (hashed semi-join)"""
+        known_keys = pd.Index(pd.unique(dim_keys.to_numpy()))
+        return int((~fact_keys.isin(known_keys)).sum())
+    
     def validate_table_inventory(self):
         """Validate which expected tables exist and identify missing/extra tables"""
         print("=" * 60)
@@ -51,7 +223,7 @@ class YardiDataModelValidator:
         print("=" * 60)
         
         # Get actual tables from CSV files
-        csv_files = list(self.data_path.glob("*.csv"))
+        csv_files = list(self._csv_index().values())
         actual_tables = {f.stem.lower() for f in csv_files}
         expected_tables_lower = {t.lower() for t in self.expected_tables}
         
@@ -69,13 +241,13 @@ class YardiDataModelValidator:
         
         if missing_tables:
             print(f"\n❌ MISSING TABLES ({len(missing_tables)}):")
-            for table in sorted(missing_tables):
+            for table in self._ordered(missing_tables):
                 print(f"  - {table}")
-                self.issues.append(f"Missing table: {table}")
+                self._record_issue('table_inventory', f"Missing table: {table}")
         
         if extra_tables:
             print(f"\n📋 EXTRA TABLES ({len(extra_tables)}):")
-            for table in sorted(extra_tables):
+            for table in self._ordered(extra_tables):
                 print(f"  + {table}")
         
         self.results['table_inventory'] = {
@@ -110,9 +282,9 @@ class YardiDataModelValidator:
         for table_name, expected_cols in critical_tables.items():
             csv_path = self.data_path / f"{table_name}.csv"
             
-            if not csv_path.exists():
+            if not self._has_table(table_name):
                 print(f"❌ {table_name}: FILE NOT FOUND")
-                self.issues.append(f"Critical table missing: {table_name}")
+                self._record_issue('table_structures', f"Critical table missing: {table_name}")
                 continue
                 
             try:
@@ -130,12 +302,12 @@ class YardiDataModelValidator:
                 if missing_cols:
                     print(f"   ❌ Missing Critical Columns: {missing_cols}")
                     for col in missing_cols:
-                        self.issues.append(f"{table_name}: Missing column '{col}'")
+                        self._record_issue('table_structures', f"{table_name}: Missing column '{col}'")
                 else:
                     print(f"   ✅ All critical columns present")
                 
                 # Check for data
-                row_count = len(pd.read_csv(csv_path))
+                row_count = len(self._load_table(table_name))
                 print(f"   Record Count: {row_count:,}")
                 
                 structure_results[table_name] = {
@@ -147,7 +319,7 @@ class YardiDataModelValidator:
                 
             except Exception as e:
                 print(f"❌ {table_name}: Error reading file - {str(e)}")
-                self.issues.append(f"{table_name}: Error reading file - {str(e)}")
+                self._record_issue('table_structures', f"{table_name}: Error reading file - {str(e)}")
                 structure_results[table_name] = {'file_exists': False, 'error': str(e)}
         
         self.results['table_structures'] = structure_results
@@ -160,16 +332,13 @@ class YardiDataModelValidator:
         
         amendment_file = self.data_path / "dim_fp_amendmentsunitspropertytenant.csv"
         
-        if not amendment_file.exists():
+        if not self._has_table(amendment_file.stem):
             print("❌ Amendment table not found - cannot validate duplicates")
-            self.issues.append("Cannot validate amendment duplicates - table missing")
+            self._record_issue('amendment_duplicates', "Cannot validate amendment duplicates - table missing")
             return
         
         try:
-            df = pd.read_csv(amendment_file)
-            
-            # Normalize column names (handle variations)
-            df.columns = df.columns.str.lower().str.strip()
+            df = self._load_table("dim_fp_amendmentsunitspropertytenant")
             
             # Map potential column name variations
             column_mapping = {
@@ -192,7 +361,7 @@ class YardiDataModelValidator:
             if missing_cols:
                 print(f"❌ Missing required columns: {missing_cols}")
                 for col in missing_cols:
-                    self.issues.append(f"Amendment table missing column: {col}")
+                    self._record_issue('amendment_duplicates', f"Amendment table missing column: {col}")
                 return
             
             # Analyze amendment data
@@ -206,12 +375,12 @@ class YardiDataModelValidator:
                 print(f"   {status}: {count:,}")
             
             # Active amendments (Activated + Superseded)
-            active_amendments = df[df[status_col].isin(['Activated', 'Superseded'])].copy()
+            active_amendments = df[df[status_col].isin(['Activated', 'Superseded'])]
             print(f"\nActive Amendments (Activated + Superseded): {len(active_amendments):,}")
             
             if len(active_amendments) == 0:
                 print("❌ No active amendments found")
-                self.issues.append("No active amendments found")
+                self._record_issue('amendment_duplicates', "No active amendments found")
                 return
             
             # Find latest amendments per property/tenant
@@ -219,16 +388,23 @@ class YardiDataModelValidator:
             tenant_col = actual_columns['tenant hmy']
             seq_col = actual_columns['amendment sequence']
             
-            # Get max sequence per property/tenant
-            latest_sequences = active_amendments.groupby([prop_col, tenant_col])[seq_col].max().reset_index()
+            # Pack property/tenant into one exact int64 key, then append the sequence in
+            # sorted code order so packed keys order by (pair, sequence); rows missing any part are skipped
+            pair_key = self._composite_key(active_amendments, [prop_col, tenant_col])
+            seq_codes, seq_values = pd.factorize(active_amendments[seq_col], sort=True)
+            valid = (pair_key >= 0) & (seq_codes >= 0)
+            seq_radix = max(len(seq_values), 1)
+            packed = pair_key[valid] * seq_radix + seq_codes[valid]
             
-            # Find duplicates (multiple amendments with same latest sequence)
-            duplicates = active_amendments.merge(
-                latest_sequences,
-                on=[prop_col, tenant_col, seq_col]
-            ).groupby([prop_col, tenant_col]).size().reset_index(name='count')
+            # One radix pass counts each (pair, sequence); the last entry per pair is its latest sequence
+            unique_keys, counts = np.unique(packed, return_counts=True)
+            pairs = unique_keys // seq_radix
+            is_last = np.ones(len(pairs), dtype=bool)
+            is_last[:-1] = pairs[1:] != pairs[:-1]
+            latest_sequences = counts[is_last]
             
-            duplicate_latest = duplicates[duplicates['count'] > 1]
+            # Find duplicates (multiple amendments with same latest sequence)
+            duplicate_latest = latest_sequences[latest_sequences > 1]
             
             print(f"\nLatest Amendment Analysis:")
             print(f"   Unique Property/Tenant Combinations: {len(latest_sequences):,}")
@@ -239,7 +415,7 @@ class YardiDataModelValidator:
                 duplicate_pct = len(duplicate_latest) / len(latest_sequences) * 100
                 print(f"   Duplicate Percentage: {duplicate_pct:.2f}%")
                 
-                self.issues.append(f"Duplicate latest amendments: {len(duplicate_latest)} combinations")
+                self._record_issue('amendment_duplicates', f"Duplicate latest amendments: {len(duplicate_latest)} combinations")
             else:
                 print(f"   ✅ No duplicate latest amendments found")
             
@@ -253,7 +429,7 @@ class YardiDataModelValidator:
             
         except Exception as e:
             print(f"❌ Error validating amendment duplicates: {str(e)}")
-            self.issues.append(f"Error validating amendment duplicates: {str(e)}")
+            self._record_issue('amendment_duplicates', f"Error validating amendment duplicates: {str(e)}")
     
     def find_orphaned_records(self):
         """Find orphaned records in fact tables"""
@@ -269,18 +445,16 @@ class YardiDataModelValidator:
         
         orphaned_results = {}
         
-        if fact_total_file.exists():
+        if self._has_table(fact_total_file.stem):
             try:
-                fact_total = pd.read_csv(fact_total_file)
-                fact_total.columns = fact_total.columns.str.lower().str.strip()
+                fact_total = self._load_table("fact_total")
                 
                 print(f"📊 FACT_TOTAL Analysis:")
                 print(f"   Total Records: {len(fact_total):,}")
                 
                 # Check property orphans
-                if dim_property_file.exists():
-                    dim_property = pd.read_csv(dim_property_file)
-                    dim_property.columns = dim_property.columns.str.lower().str.strip()
+                if self._has_table(dim_property_file.stem):
+                    dim_property = self._load_table("dim_property")
                     
                     # Find common property ID column
                     prop_id_col_fact = None
@@ -297,24 +471,23 @@ class YardiDataModelValidator:
                             break
                     
                     if prop_id_col_fact and prop_id_col_dim:
-                        orphaned_props = fact_total[~fact_total[prop_id_col_fact].isin(dim_property[prop_id_col_dim])]
-                        orphan_pct = len(orphaned_props) / len(fact_total) * 100
+                        orphan_count = self._count_orphans(fact_total[prop_id_col_fact], dim_property[prop_id_col_dim])
+                        orphan_pct = orphan_count / len(fact_total) * 100
                         
-                        print(f"   Property Orphans: {len(orphaned_props):,} ({orphan_pct:.2f}%)")
+                        print(f"   Property Orphans: {orphan_count:,} ({orphan_pct:.2f}%)")
                         
-                        if len(orphaned_props) > 0:
-                            self.issues.append(f"fact_total: {len(orphaned_props)} orphaned property records")
+                        if orphan_count > 0:
+                            self._record_issue('orphaned_records', f"fact_total: {orphan_count} orphaned property records")
                             
                         orphaned_results['property_orphans'] = {
-                            'count': len(orphaned_props),
+                            'count': orphan_count,
                             'percentage': orphan_pct,
                             'total_records': len(fact_total)
                         }
                 
                 # Check account orphans
-                if dim_account_file.exists():
-                    dim_account = pd.read_csv(dim_account_file)
-                    dim_account.columns = dim_account.columns.str.lower().str.strip()
+                if self._has_table(dim_account_file.stem):
+                    dim_account = self._load_table("dim_account")
                     
                     # Find common account ID column
                     acc_id_col_fact = None
@@ -331,16 +504,16 @@ class YardiDataModelValidator:
                             break
                     
                     if acc_id_col_fact and acc_id_col_dim:
-                        orphaned_accs = fact_total[~fact_total[acc_id_col_fact].isin(dim_account[acc_id_col_dim])]
-                        orphan_pct = len(orphaned_accs) / len(fact_total) * 100
+                        orphan_count = self._count_orphans(fact_total[acc_id_col_fact], dim_account[acc_id_col_dim])
+                        orphan_pct = orphan_count / len(fact_total) * 100
                         
-                        print(f"   Account Orphans: {len(orphaned_accs):,} ({orphan_pct:.2f}%)")
+                        print(f"   Account Orphans: {orphan_count:,} ({orphan_pct:.2f}%)")
                         
-                        if len(orphaned_accs) > 0:
-                            self.issues.append(f"fact_total: {len(orphaned_accs)} orphaned account records")
+                        if orphan_count > 0:
+                            self._record_issue('orphaned_records', f"fact_total: {orphan_count} orphaned account records")
                             
                         orphaned_results['account_orphans'] = {
-                            'count': len(orphaned_accs),
+                            'count': orphan_count,
                             'percentage': orphan_pct,
                             'total_records': len(fact_total)
                         }
@@ -349,10 +522,10 @@ class YardiDataModelValidator:
                 
             except Exception as e:
                 print(f"❌ Error analyzing orphaned records: {str(e)}")
-                self.issues.append(f"Error analyzing orphaned records: {str(e)}")
+                self._record_issue('orphaned_records', f"Error analyzing orphaned records: {str(e)}")
         else:
             print("❌ fact_total.csv not found")
-            self.issues.append("fact_total table missing - cannot check orphaned records")
+            self._record_issue('orphaned_records', "fact_total table missing - cannot check orphaned records")
     
     def validate_amendment_rent_charges(self):
         """Identify amendments missing rent charges"""
@@ -363,22 +536,19 @@ class YardiDataModelValidator:
         amendment_file = self.data_path / "dim_fp_amendmentsunitspropertytenant.csv"
         charges_file = self.data_path / "dim_fp_amendmentchargeschedule.csv"
         
-        if not amendment_file.exists():
+        if not self._has_table(amendment_file.stem):
             print("❌ Amendment table not found")
-            self.issues.append("Amendment table missing - cannot validate rent charges")
+            self._record_issue('amendment_rent_charges', "Amendment table missing - cannot validate rent charges")
             return
         
-        if not charges_file.exists():
+        if not self._has_table(charges_file.stem):
             print("❌ Charge schedule table not found")
-            self.issues.append("Charge schedule table missing - cannot validate rent charges")
+            self._record_issue('amendment_rent_charges', "Charge schedule table missing - cannot validate rent charges")
             return
         
         try:
-            amendments = pd.read_csv(amendment_file)
-            charges = pd.read_csv(charges_file)
-            
-            amendments.columns = amendments.columns.str.lower().str.strip()
-            charges.columns = charges.columns.str.lower().str.strip()
+            amendments = self._load_table("dim_fp_amendmentsunitspropertytenant")
+            charges = self._load_table("dim_fp_amendmentchargeschedule")
             
             # Find amendment HMY column
             amendment_id_col = None
@@ -395,7 +565,7 @@ class YardiDataModelValidator:
             
             if not amendment_id_col or not charges_amendment_col:
                 print("❌ Cannot find amendment ID columns for linking")
-                self.issues.append("Missing amendment ID columns for rent charge validation")
+                self._record_issue('amendment_rent_charges', "Missing amendment ID columns for rent charge validation")
                 return
             
             # Get active amendments
@@ -413,63 +583,70 @@ class YardiDataModelValidator:
             print(f"Active Amendments: {len(active_amendments):,}")
             print(f"Charge Records: {len(charges):,}")
             
-            # Find amendments without charges
-            amendments_with_charges = active_amendments[active_amendments[amendment_id_col].isin(charges[charges_amendment_col])]
-            amendments_without_charges = active_amendments[~active_amendments[amendment_id_col].isin(charges[charges_amendment_col])]
+            # Find amendments without charges (anti-join against the distinct charged amendments)
+            charged_ids = pd.Index(pd.unique(charges[charges_amendment_col].to_numpy()))
+            has_charges = active_amendments[amendment_id_col].isin(charged_ids).to_numpy()
+            with_charges_count = int(has_charges.sum())
+            missing_ids = active_amendments[amendment_id_col].to_numpy()[~has_charges]
+            without_charges_count = len(missing_ids)
             
-            missing_charges_pct = len(amendments_without_charges) / len(active_amendments) * 100
+            missing_charges_pct = without_charges_count / len(active_amendments) * 100
             
             print(f"\nRent Charges Analysis:")
-            print(f"   Amendments with Charges: {len(amendments_with_charges):,}")
-            print(f"   Amendments without Charges: {len(amendments_without_charges):,}")
+            print(f"   Amendments with Charges: {with_charges_count:,}")
+            print(f"   Amendments without Charges: {without_charges_count:,}")
             print(f"   Missing Charges Percentage: {missing_charges_pct:.2f}%")
             
-            if len(amendments_without_charges) > 0:
-                print(f"   ❌ Found {len(amendments_without_charges)} amendments missing rent charges")
-                self.issues.append(f"Amendments missing rent charges: {len(amendments_without_charges)}")
+            if without_charges_count > 0:
+                print(f"   ❌ Found {without_charges_count} amendments missing rent charges")
+                self._record_issue('amendment_rent_charges', f"Amendments missing rent charges: {without_charges_count}")
             else:
                 print(f"   ✅ All amendments have associated charges")
             
             self.results['amendment_rent_charges'] = {
                 'total_active_amendments': len(active_amendments),
-                'amendments_with_charges': len(amendments_with_charges),
-                'amendments_without_charges': len(amendments_without_charges),
-                'missing_charges_percentage': missing_charges_pct
+                'amendments_with_charges': with_charges_count,
+                'amendments_without_charges': without_charges_count,
+                'missing_charges_percentage': missing_charges_pct,
+                'missing_charge_amendment_ids': self._ordered(missing_ids.tolist())
             }
             
         except Exception as e:
             print(f"❌ Error validating amendment rent charges: {str(e)}")
-            self.issues.append(f"Error validating amendment rent charges: {str(e)}")
+            self._record_issue('amendment_rent_charges', f"Error validating amendment rent charges: {str(e)}")
     
-    def generate_baseline_metrics(self):
-        """Generate baseline metrics and data quality indicators"""
-        print("\n" + "=" * 60)
-        print("6. BASELINE METRICS CALCULATION")
-        print("=" * 60)
-        
+    def _table_digest(self, table_names=None):
+        """Fingerprint the given tables (default: the whole extract) from each CSV's name, size and mtime"""
+        index = self._csv_index()
+        digest = hashlib.blake2b(digest_size=16)
+        for name in sorted(index if table_names is None else table_names):
+            csv_file = index.get(name)
+            if csv_file is None:
+                digest.update(f"{name}:missing\n".encode())
+                continue
+            stat = csv_file.stat()
+            digest.update(f"{csv_file.name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+        return digest.hexdigest()
+    
+    def _compute_baseline_metrics(self):
+        """Count records and columns in every table"""
         total_records = 0
         table_metrics = {}
         
-        # Count records in each table
-        for csv_file in self.data_path.glob("*.csv"):
+        for csv_file in self._csv_index().values():
             try:
-                df = pd.read_csv(csv_file)
-                record_count = len(df)
+                record_count, column_count = self._count_table(csv_file)
                 total_records += record_count
                 
                 table_metrics[csv_file.stem] = {
                     'record_count': record_count,
-                    'column_count': len(df.columns),
+                    'column_count': column_count,
                     'file_size_mb': csv_file.stat().st_size / 1024 / 1024
                 }
                 
             except Exception as e:
-                print(f"❌ Error reading {csv_file.name}: {str(e)}")
                 table_metrics[csv_file.stem] = {'error': str(e)}
         
-        print(f"Total Records Across All Tables: {total_records:,}")
-        print(f"Tables with Data: {len([t for t in table_metrics if 'record_count' in table_metrics[t]]):,}")
-        
         # Top 10 largest tables by record count
         tables_by_size = sorted(
             [(name, metrics) for name, metrics in table_metrics.items() if 'record_count' in metrics],
@@ -477,17 +654,60 @@ class YardiDataModelValidator:
             reverse=True
         )[:10]
         
-        print(f"\nTop 10 Tables by Record Count:")
-        for name, metrics in tables_by_size:
-            print(f"   {name}: {metrics['record_count']:,} records, {metrics['column_count']} columns")
-        
-        self.results['baseline_metrics'] = {
+        return {
             'total_records': total_records,
             'total_tables': len(table_metrics),
             'table_metrics': table_metrics,
             'largest_tables': dict(tables_by_size)
         }
     
+    def generate_baseline_metrics(self):
+        """Generate baseline metrics and data quality indicators"""
+        print("\n" + "=" * 60)
+        print("6. BASELINE METRICS CALCULATION")
+        print("=" * 60)
+        
+        # Reuse metrics from a previous run when no table file has changed; entries are
+        # prefixed per data directory since several extracts can share one cache dir
+        path_key = hashlib.blake2b(str(self.data_path.resolve()).encode(), digest_size=8).hexdigest()
+        cache_file = self.cache_dir / f"baseline_{path_key}_{self._table_digest()}.json"
+        baseline = None
+        if cache_file.exists():
+            try:
+                with open(cache_file) as f:
+                    baseline = json.load(f)
+                print("Using cached baseline metrics (table files unchanged)")
+            except (OSError, ValueError):
+                baseline = None
+        
+        if baseline is None:
+            baseline = self._compute_baseline_metrics()
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                with open(cache_file, 'w') as f:
+                    json.dump(baseline, f, indent=2)
+                
+                # Entries for older digests of this data directory can never be hit again
+                for stale in self.cache_dir.glob(f"baseline_{path_key}_*.json"):
+                    if stale != cache_file:
+                        stale.unlink(missing_ok=True)
+            except OSError as e:
+                print(f"⚠️  Could not write baseline cache: {str(e)}")
+        
+        table_metrics = baseline['table_metrics']
+        for name, metrics in table_metrics.items():
+            if 'error' in metrics:
+                print(f"❌ Error reading {name}.csv: {metrics['error']}")
+        
+        print(f"Total Records Across All Tables: {baseline['total_records']:,}")
+        print(f"Tables with Data: {len([t for t in table_metrics if 'record_count' in table_metrics[t]]):,}")
+        
+        print(f"\nTop 10 Tables by Record Count:")
+        for name, metrics in baseline['largest_tables'].items():
+            print(f"   {name}: {metrics['record_count']:,} records, {metrics['column_count']} columns")
+        
+        self.results['baseline_metrics'] = baseline
+    
     def calculate_integrity_score(self):
         """Calculate overall data model integrity score"""
         print("\n" + "=" * 60)
@@ -553,7 +773,7 @@ class YardiDataModelValidator:
         critical_tables_present = 0
         critical_tables = ['fact_total', 'dim_property', 'dim_fp_amendmentsunitspropertytenant', 'dim_fp_amendmentchargeschedule']
         for table in critical_tables:
-            if (self.data_path / f"{table}.csv").exists():
+            if self._has_table(table):
                 critical_tables_present += 1
         
         critical_score = (critical_tables_present / len(critical_tables)) * 100
@@ -599,73 +819,214 @@ class YardiDataModelValidator:
     
     def generate_final_report(self):
         """Generate comprehensive validation report"""
-        print("\n" + "=" * 80)
-        print("YARDI POWER BI DATA MODEL VALIDATION REPORT")
-        print("=" * 80)
-        print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"Data Path: {self.data_path}")
+        # Buffer the report and emit it with a single write
+        report = io.StringIO()
+        
+        print("\n" + "=" * 80, file=report)
+        print("YARDI POWER BI DATA MODEL VALIDATION REPORT", file=report)
+        print("=" * 80, file=report)
+        print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", file=report)
+        print(f"Data Path: {self.data_path}", file=report)
         
         if 'integrity_score' in self.results:
-            print(f"\n🎯 OVERALL INTEGRITY SCORE: {self.results['integrity_score']['final_score']:.1f}/100")
-            print(f"🏆 GRADE: {self.results['integrity_score']['grade']}")
+            print(f"\n🎯 OVERALL INTEGRITY SCORE: {self.results['integrity_score']['final_score']:.1f}/100", file=report)
+            print(f"🏆 GRADE: {self.results['integrity_score']['grade']}", file=report)
         
-        print(f"\n📊 SUMMARY STATISTICS:")
+        print(f"\n📊 SUMMARY STATISTICS:", file=report)
         if 'table_inventory' in self.results:
-            print(f"   Expected Tables: {self.results['table_inventory']['expected_count']}")
-            print(f"   Found Tables: {self.results['table_inventory']['actual_count']}")
-            print(f"   Missing Tables: {self.results['table_inventory']['missing_count']}")
+            print(f"   Expected Tables: {self.results['table_inventory']['expected_count']}", file=report)
+            print(f"   Found Tables: {self.results['table_inventory']['actual_count']}", file=report)
+            print(f"   Missing Tables: {self.results['table_inventory']['missing_count']}", file=report)
         
         if 'baseline_metrics' in self.results:
-            print(f"   Total Records: {self.results['baseline_metrics']['total_records']:,}")
+            print(f"   Total Records: {self.results['baseline_metrics']['total_records']:,}", file=report)
         
-        print(f"\n🚨 CRITICAL ISSUES FOUND: {len(self.issues)}")
+        print(f"\n🚨 CRITICAL ISSUES FOUND: {len(self.issues)}", file=report)
         if self.issues:
             for i, issue in enumerate(self.issues, 1):
-                print(f"   {i}. {issue}")
+                print(f"   {i}. {issue}", file=report)
         else:
-            print("   ✅ No critical issues found!")
+            print("   ✅ No critical issues found!", file=report)
         
-        print(f"\n📋 RECOMMENDATIONS:")
+        print(f"\n📋 RECOMMENDATIONS:", file=report)
         if 'table_inventory' in self.results and self.results['table_inventory']['missing_count'] > 0:
-            print(f"   1. Add missing tables: {', '.join(self.results['table_inventory']['missing_tables'])}")
+            print(f"   1. Add missing tables: {', '.join(self.results['table_inventory']['missing_tables'])}", file=report)
         
         if 'amendment_duplicates' in self.results and self.results['amendment_duplicates']['duplicate_latest'] > 0:
-            print(f"   2. Resolve {self.results['amendment_duplicates']['duplicate_latest']} duplicate amendment issues")
+            print(f"   2. Resolve {self.results['amendment_duplicates']['duplicate_latest']} duplicate amendment issues", file=report)
         
-        if any('orphaned' in issue.lower() for issue in self.issues):
-            print(f"   3. Clean up orphaned records in fact tables")
+        if self.issue_counts['orphaned_records']:
+            print(f"   3. Clean up orphaned records in fact tables", file=report)
         
         if 'amendment_rent_charges' in self.results and self.results['amendment_rent_charges']['amendments_without_charges'] > 0:
-            print(f"   4. Add missing rent charge records for {self.results['amendment_rent_charges']['amendments_without_charges']} amendments")
+            print(f"   4. Add missing rent charge records for {self.results['amendment_rent_charges']['amendments_without_charges']} amendments", file=report)
+        
+        print(f"\n✅ NEXT STEPS:", file=report)
+        print(f"   1. Review and address critical issues listed above", file=report)
+        print(f"   2. Run Phase 2 DAX validation after data cleanup", file=report)
+        print(f"   3. Implement data quality monitoring", file=report)
+        print(f"   4. Schedule regular validation runs", file=report)
+        
+        sys.stdout.write(report.getvalue())
+        sys.stdout.flush()
+        
+        # Release cached tables once the report is complete
+        self._release_tables()
+        
+        return self.results
+    
+    def save_results(self, results_path):
+        """Write the validation results as a machine-readable JSON artifact"""
+        with open(results_path, 'w') as f:
+            json.dump(self.results, f, indent=2, default=str)
+    
+    @staticmethod
+    def _flatten_results(results, prefix=''):
+        """Flatten nested result dicts into dotted keys; lists compare order-insensitively"""
+        flat = {}
+        for key, value in results.items():
+            name = f"{prefix}{key}"
+            if isinstance(value, dict):
+                flat.update(YardiDataModelValidator._flatten_results(value, f"{name}."))
+            elif isinstance(value, list):
+                flat[name] = sorted(value, key=str)
+            else:
+                flat[name] = value
+        return flat
+    
+    def generate_change_report(self, previous_results):
+        """Report only the result values that changed since a previous run's JSON artifact"""
+        report = io.StringIO()
+        
+        print("\n" + "=" * 80, file=report)
+        print("YARDI POWER BI DATA MODEL VALIDATION - CHANGES SINCE LAST RUN", file=report)
+        print("=" * 80, file=report)
+        print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", file=report)
+        print(f"Data Path: {self.data_path}", file=report)
+        
+        # Round-trip through JSON so both sides compare with the same types
+        previous = self._flatten_results(previous_results)
+        current = self._flatten_results(json.loads(json.dumps(self.results, default=str)))
+        changed = [key for key in sorted(previous.keys() | current.keys()) if previous.get(key) != current.get(key)]
+        
+        def describe(value):
+            return f"[{len(value)} items]" if isinstance(value, list) else value
         
-        print(f"\n✅ NEXT STEPS:")
-        print(f"   1. Review and address critical issues listed above")
-        print(f"   2. Run Phase 2 DAX validation after data cleanup")
-        print(f"   3. Implement data quality monitoring")
-        print(f"   4. Schedule regular validation runs")
+        print(f"\n🔄 CHANGED VALUES: {len(changed)}", file=report)
+        if changed:
+            for key in changed:
+                print(f"   {key}: {describe(previous.get(key, '-'))} → {describe(current.get(key, '-'))}", file=report)
+        else:
+            print("   ✅ No changes since the previous run", file=report)
+        
+        sys.stdout.write(report.getvalue())
+        sys.stdout.flush()
+        
+        self._release_tables()
+        
+        return self.results
+
+    def reset(self):
+        """Clear results, issues and cached tables so the validator can run again"""
+        self._release_tables()
+        self.results = {}
+        self.issues = []
+        self.issue_counts = Counter()
+        self.phase_state = {}
+    
+    def run_validation(self, phase_state=None):
+        """Run all validation phases, reusing phase results whose input tables are unchanged"""
+        self.reset()
+        previous = phase_state or {}
+        
+        digests = {
+            phase: self._table_digest(tables)
+            for phase, (_, tables) in self.INCREMENTAL_PHASES.items()
+        }
+        stale = {
+            phase for phase in self.INCREMENTAL_PHASES
+            if previous.get(phase, {}).get('digest') != digests[phase]
+        }
+        
+        # Start reading the tables of phases that must re-run while the inventory check runs
+        stale_tables = {table for phase in stale for table in self.INCREMENTAL_PHASES[phase][1]}
+        self.prefetch_tables([name for name in self.PHASE_TABLES if name in stale_tables])
+        
+        self.validate_table_inventory()
+        
+        for phase, (key, _) in self.INCREMENTAL_PHASES.items():
+            if phase in stale:
+                issue_start = len(self.issues)
+                getattr(self, phase)()
+                self.phase_state[phase] = {
+                    'digest': digests[phase],
+                    'results': self.results.get(key),
+                    'issues': self.issues[issue_start:]
+                }
+            else:
+                saved = previous[phase]
+                print(f"\n⏭️  {phase}: input tables unchanged, reusing previous result")
+                if saved['results'] is not None:
+                    self.results[key] = saved['results']
+                for message in saved['issues']:
+                    self._record_issue(key, message)
+                self.phase_state[phase] = saved
+        
+        self.generate_baseline_metrics()
+        self.calculate_integrity_score()
         
         return self.results
 
 def main():
     """Main execution function"""
-    data_path = "/Users/michaeltang/Documents/GitHub/BI/PBI v1.7/Data/Yardi_Tables"
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Validate the Yardi Power BI data model')
+    parser.add_argument('--data-path', default=os.environ.get('YARDI_DATA_PATH', DEFAULT_DATA_PATH),
+                        help='Directory of Yardi table CSVs (default: $YARDI_DATA_PATH or Data/Yardi_Tables)')
+    parser.add_argument('--cache-dir', default=os.environ.get('YARDI_CACHE_DIR', DEFAULT_CACHE_DIR),
+                        help='Directory for cached baseline metrics (default: $YARDI_CACHE_DIR or ~/.cache/yardi-powerbi)')
+    parser.add_argument('--skip-output-sort', action='store_true',
+                        help='List missing tables and amendment IDs unsorted (counts are unaffected)')
+    parser.add_argument('--results-json', default=None,
+                        help='Write results to this JSON file (and compare against it with --changes-only)')
+    parser.add_argument('--changes-only', action='store_true',
+                        help='Print only values that changed since the previous --results-json run')
+    parser.add_argument('--state-file', default=None,
+                        help='Phase state JSON; phases whose input tables are unchanged reuse their saved results')
+    args = parser.parse_args()
+    data_path = args.data_path
+    
+    previous_results = None
+    if args.changes_only and args.results_json and os.path.exists(args.results_json):
+        with open(args.results_json) as f:
+            previous_results = json.load(f)
     
     print("🔍 Starting Yardi Power BI Data Model Validation")
     print(f"📁 Data Path: {data_path}")
     
-    validator = YardiDataModelValidator(data_path)
+    validator = YardiDataModelValidator(data_path, cache_dir=args.cache_dir, sort_output=not args.skip_output_sort)
+    
+    phase_state = None
+    if args.state_file and os.path.exists(args.state_file):
+        with open(args.state_file) as f:
+            phase_state = json.load(f)
     
     # Run all validation steps
-    existing_tables = validator.validate_table_inventory()
-    validator.analyze_table_structures()
-    validator.validate_amendment_duplicates()
-    validator.find_orphaned_records()
-    validator.validate_amendment_rent_charges()
-    validator.generate_baseline_metrics()
-    validator.calculate_integrity_score()
-    
-    # Generate final report
-    results = validator.generate_final_report()
+    validator.run_validation(phase_state)
+    
+    # Generate final report (or just the deltas against the previous artifact)
+    if previous_results is not None:
+        results = validator.generate_change_report(previous_results)
+    else:
+        results = validator.generate_final_report()
+    
+    if args.results_json:
+        validator.save_results(args.results_json)
+    
+    if args.state_file:
+        with open(args.state_file, 'w') as f:
+            json.dump(validator.phase_state, f, indent=2, default=str)
     
     return results
 
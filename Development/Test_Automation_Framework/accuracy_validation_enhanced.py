@@ -24,13 +24,25 @@ import pandas as pd
 import numpy as np
 import os
 import sys
+import functools
+import hashlib
 import json
 import logging
+import operator
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional, Any, Union
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 import traceback
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add the existing validation scripts to path
 sys.path.append('/Users/michaeltang/Documents/GitHub/BI/PBI v1.7/python scripts')
 sys.path.append('/Users/michaeltang/Documents/GitHub/BI/PBI v1.7/Fund2_Validation_Results')
@@ -38,14 +50,28 @@ sys.path.append('/Users/michaeltang/Documents/GitHub/BI/PBI v1.7/Fund2_Validatio
 try:
     from clean_rent_roll import RentRollCleaner
     from validate_fund2_accuracy import Fund2AccuracyValidator
+    _HAS_CLEANER = True
 except ImportError as e:
+    _HAS_CLEANER = 'RentRollCleaner' in globals()
     logging.warning(f"Could not import existing validators: {e}")
 
 logger = logging.getLogger(__name__)
 
+# Fixed recommendations for error and missing-file results; each result gets its own list copy
+_ERROR_RECOMMENDATIONS = ("Fix test execution error and retry",)
+_FILE_MISSING_RECOMMENDATIONS = ("Ensure all required test data files are available",)
+
 @dataclass
 class AccuracyTestResult:
     """Enhanced result structure for accuracy testing"""
+    # Declared by hand rather than @dataclass(slots=True) to stay importable on Python 3.8/3.9;
+    # must name the annotated fields below in order (checked after the class)
+    __slots__ = (
+        'test_id', 'test_name', 'category', 'target_accuracy', 'actual_accuracy',
+        'variance_amount', 'variance_pct', 'status', 'critical_issues', 'recommendations',
+        'detailed_metrics', 'execution_time', 'timestamp'
+    )
+    
     test_id: str
     test_name: str
     category: str
@@ -60,27 +86,307 @@ class AccuracyTestResult:
     execution_time: float
     timestamp: datetime
 
+assert AccuracyTestResult.__slots__ == tuple(f.name for f in fields(AccuracyTestResult)), \
+    "AccuracyTestResult.__slots__ is out of sync with its fields"
+
+def _json_default(obj: Any) -> str:
+    """JSON fallback: ISO 8601 for datetimes (matching orjson's native output), str() otherwise"""
+    return obj.isoformat() if isinstance(obj, datetime) else str(obj)
+
+def _accuracy_test(test_name: str):
+    """Time a test method, stamp its result, and turn exceptions into an error result
+
+    The wall-clock timestamp is read once at the start; the duration comes from
+    the monotonic perf_counter, and error results are stamped the same way.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            t0 = time.perf_counter()
+            start_time = datetime.now()
+            try:
+                result = method(self, *args, **kwargs)
+            except Exception as e:
+                result = self._create_error_result(test_name, str(e))
+            result.execution_time = time.perf_counter() - t0
+            result.timestamp = start_time
+            return result
+        return wrapper
+    return decorator
+
+def _latest_with_charges(prop: np.ndarray, tenant: np.ndarray, seq: np.ndarray,
+                         amend_hmy: np.ndarray, charge_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Latest amendment per property/tenant and whether it has charges, in one sorted pass.
+    
+    Rows are sorted once by property, tenant and sequence, so the last row of each
+    property/tenant run is its latest amendment (ties keep the earliest row, as idxmax
+    does). Returns the row positions of those amendments and a charge membership mask.
+    """
+    n = len(prop)
+    order = np.lexsort((-np.arange(n), seq, tenant, prop))
+    prop_sorted, tenant_sorted = prop[order], tenant[order]
+    
+    run_end = np.ones(n, dtype=bool)
+    run_end[:-1] = (prop_sorted[1:] != prop_sorted[:-1]) | (tenant_sorted[1:] != tenant_sorted[:-1])
+    latest_pos = order[run_end]
+    
+    return latest_pos, np.isin(amend_hmy[latest_pos], charge_ids)
+
 class EnhancedAccuracyValidator:
     """Enhanced accuracy validator addressing Fund 2 critical issues"""
     
+    # Amendment statuses used for rent calculations
+    _ACTIVE_STATUSES = ['Activated', 'Superseded']
+    
+    # Columns the tests read from each Fund 2 extract
+    _AMEND_COLS = [
+        'amendment hmy', 'property hmy', 'tenant hmy', 'amendment sequence', 'amendment status',
+        'amendment start date', 'amendment end date'
+    ]
+    _CHARGE_COLS = ['amendment hmy', 'amount', 'charge_type', 'description']
+    _DTYPES = {
+        'amendment hmy': 'int64',
+        'property hmy': 'int64',
+        'tenant hmy': 'int64',
+        'amendment sequence': 'int64',
+        'amendment status': 'category'
+    }
+    # Parsed to datetimes at read time (unparseable columns are left as text)
+    _DATE_COLS = ['amendment start date', 'amendment end date']
+    # Yardi extracts write dates as M/D/YYYY; an explicit format skips per-value inference
+    _DATE_FORMAT = '%m/%d/%Y'
+    # Narrower integer types applied after load when the values fit
+    _NARROW_INTS = {
+        'amendment hmy': np.int32,
+        'property hmy': np.int32,
+        'tenant hmy': np.int32,
+        'amendment sequence': np.int16
+    }
+    # Name fragments of the Yardi columns _calculate_comprehensive_metrics can use
+    _METRIC_COL_TERMS = ('prop', 'tenant', 'rent', 'month', 'amount', 'sf', 'square', 'area', 'footage')
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.data_path = config.get('data_path', '/Users/michaeltang/Documents/GitHub/BI/PBI v1.7/Data')
         self.results_path = config.get('results_path', '/Users/michaeltang/Documents/GitHub/BI/PBI v1.7/Fund2_Validation_Results')
         self.yardi_path = config.get('yardi_path', '/Users/michaeltang/Documents/GitHub/BI/PBI v1.7/rent rolls')
+        # Parquet copies of slow-to-parse inputs, kept apart from the source data
+        self.cache_path = config.get('cache_path', os.path.join(
+            os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'yardi-powerbi'
+        ))
+        
+        # Input file paths resolved once; existence is checked when the tests run
+        self._fund2_dir = os.path.join(self.data_path, 'Fund2_Filtered')
+        self._paths = {
+            'amendments': os.path.join(self._fund2_dir, 'dim_fp_amendmentsunitspropertytenant_fund2.csv'),
+            'charges': os.path.join(self._fund2_dir, 'dim_fp_amendmentchargeschedule_fund2_active.csv'),
+            'generated_rent_roll': os.path.join(self.results_path, 'fund2_rent_roll_generated_mar31_2025.csv'),
+            'yardi_mar31': os.path.join(self.yardi_path, '03.31.25.xlsx')
+        }
+        self._dir_listings: Dict[str, frozenset] = {}
+        
+        # Rows per chunk when streaming large charge schedules (None reads whole files)
+        self.chunksize = config.get('chunksize')
         
         self.results: List[AccuracyTestResult] = []
+        
+        # Reference time for date filters, fixed at the start of each validation run
+        self._current_date: Optional[datetime] = None
         self.rent_roll_cleaner = None
         
+        # Parsed CSVs keyed by path so each file is read once per validator,
+        # plus frames/indexes derived from them that several tests share
+        self._df_cache: Dict[str, pd.DataFrame] = {}
+        # Re-entrant: derived values are built under the lock and load their source files through _load
+        self._load_lock = threading.RLock()
+        self._derived: Dict[Tuple[str, str], Any] = {}
+        
         # Initialize rent roll cleaner if available
-        try:
-            self.rent_roll_cleaner = RentRollCleaner(verbose=False)
-        except:
+        if _HAS_CLEANER:
+            try:
+                self.rent_roll_cleaner = RentRollCleaner(verbose=False)
+            except Exception as e:
+                logger.warning(f"RentRollCleaner init failed - some tests may be limited: {e}")
+        else:
             logger.warning("RentRollCleaner not available - some tests may be limited")
     
+    def _load(self, path: str) -> pd.DataFrame:
+        """Read a CSV once and serve later requests from the cache"""
+        # Categories run concurrently; the lock keeps a file from being parsed twice
+        with self._load_lock:
+            if path not in self._df_cache:
+                self._df_cache[path] = self._read_csv(path)
+            return self._df_cache[path]
+    
+    def _read_csv(self, path: str) -> pd.DataFrame:
+        """Read only the columns the tests use, via pyarrow when available"""
+        file_name = os.path.basename(path)
+        if 'amendmentchargeschedule' in file_name:
+            wanted = self._CHARGE_COLS
+        elif 'amendmentsunitspropertytenant' in file_name:
+            wanted = self._AMEND_COLS
+        elif 'rent_roll' in file_name:
+            return self._read_rent_roll_csv(path)
+        else:
+            return pd.read_csv(path)
+        
+        header = pd.read_csv(path, nrows=0).columns
+        usecols = [col for col in wanted if col in header]
+        dtypes = {col: dtype for col, dtype in self._DTYPES.items() if col in usecols}
+        date_cols = [col for col in self._DATE_COLS if col in usecols]
+        
+        try:
+            df = pd.read_csv(path, engine='pyarrow', usecols=usecols, dtype=dtypes,
+                             parse_dates=date_cols, date_format=self._DATE_FORMAT)
+        except (ImportError, ValueError):
+            # No pyarrow, or id columns with gaps that cannot be held as int64
+            categories = {col: dtype for col, dtype in dtypes.items() if dtype == 'category'}
+            df = pd.read_csv(path, usecols=usecols, dtype=categories,
+                             parse_dates=date_cols, date_format=self._DATE_FORMAT)
+        
+        # Halve the bytes scanned by groupby/isin on ids; keep int64 if values do not fit
+        for col, dtype in self._NARROW_INTS.items():
+            if col in df.columns and df[col].dtype == np.int64 and len(df) > 0:
+                bounds = np.iinfo(dtype)
+                if bounds.min <= df[col].min() and df[col].max() <= bounds.max:
+                    df[col] = df[col].astype(dtype)
+        
+        return df
+    
+    def _parse_dates(self, values: pd.Series) -> pd.Series:
+        """Parse with the known extract date format, coercing per value only if that fails"""
+        try:
+            return pd.to_datetime(values, format=self._DATE_FORMAT)
+        except (ValueError, TypeError):
+            return pd.to_datetime(values, errors='coerce')
+    
+    def _read_rent_roll_csv(self, path: str) -> pd.DataFrame:
+        """Read a generated rent roll, keeping only columns the comprehensive metrics can use"""
+        header = pd.read_csv(path, nrows=0).columns
+        # Fall back to every column if none match, so record_count still sees the rows
+        usecols = [col for col in header if any(term in str(col).lower() for term in self._METRIC_COL_TERMS)] or None
+        try:
+            return pd.read_csv(path, engine='pyarrow', usecols=usecols)
+        except (ImportError, ValueError):
+            return pd.read_csv(path, usecols=usecols)
+    
+    def _iter_chunks(self, path: str, columns: List[str]):
+        """Stream the given columns of a CSV in chunks of self.chunksize rows"""
+        return pd.read_csv(path, usecols=lambda col: col in columns, chunksize=self.chunksize)
+    
+    def _read_yardi_export(self, path: str) -> pd.DataFrame:
+        """Read a Yardi export, reusing a Parquet copy of Excel files when it is current"""
+        if not path.endswith('.xlsx'):
+            return pd.read_csv(path)
+        
+        # openpyxl parsing is the slowest load here; the same monthly export is re-read every run.
+        # The copy is named after the source path so exports with the same file name do not collide
+        path_key = hashlib.blake2b(os.path.abspath(path).encode(), digest_size=8).hexdigest()
+        parquet_path = os.path.join(self.cache_path, f"{os.path.basename(path)}.{path_key}.parquet")
+        if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(path):
+            try:
+                return pd.read_parquet(parquet_path, engine='pyarrow')
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable Parquet cache {parquet_path}: {e}")
+        
+        # pandas opens the workbook read-only; keep only columns the metrics can use
+        df = pd.read_excel(
+            path, sheet_name=0, engine='openpyxl',
+            usecols=lambda col: any(term in str(col).lower() for term in self._METRIC_COL_TERMS)
+        )
+        try:
+            os.makedirs(self.cache_path, exist_ok=True)
+            df.to_parquet(parquet_path, engine='pyarrow', compression='zstd')
+        except Exception as e:
+            # No pyarrow, unwritable cache directory, or mixed-type columns Arrow cannot store
+            logger.warning(f"Could not cache {path} as Parquet: {e}")
+        return df
+    
+    def _charge_sums(self, charges_file: str) -> pd.Series:
+        """Summed charge amount per amendment, streamed when a chunksize is configured"""
+        if not self.chunksize:
+            return self._load(charges_file).groupby('amendment hmy', sort=False)['amount'].sum()
+        
+        charge_sum = pd.Series(dtype=np.float64)
+        for chunk in self._iter_chunks(charges_file, ['amendment hmy', 'amount']):
+            chunk_sum = chunk.groupby('amendment hmy', sort=False)['amount'].sum()
+            charge_sum = chunk_sum if charge_sum.empty else charge_sum.add(chunk_sum, fill_value=0)
+        return charge_sum
+    
+    def _summarize_charge_amounts(self, frames) -> Tuple[int, Dict[str, Any]]:
+        """Row count and amount accuracy indicators over one or more charge frames"""
+        total_charges = 0
+        class_counts = np.zeros(4, dtype=np.int64)
+        amounts = []
+        
+        for frame in frames:
+            total_charges += len(frame)
+            if 'amount' in frame.columns:
+                amt = frame['amount'].to_numpy(dtype=np.float64, copy=False)
+                
+                # Check for common accuracy issues in one pass:
+                # 0 = negative, 1 = zero, 2 = extreme (>$50k/month), 3 = ok or missing
+                code = np.where(amt < 0, 0, np.where(amt == 0, 1, np.where(amt > 50000, 2, 3)))
+                class_counts += np.bincount(code, minlength=4)
+                amounts.append(amt)
+        
+        if not amounts:
+            return total_charges, {}
+        
+        # The median needs every amount; only this one column is kept across chunks
+        amt = np.concatenate(amounts)
+        negative_amounts, zero_amounts, extreme_amounts = class_counts[:3]
+        
+        return total_charges, {
+            'total_charges': total_charges,
+            'negative_amounts': negative_amounts,
+            'zero_amounts': zero_amounts,
+            'extreme_amounts': extreme_amounts,
+            'mean_amount': np.nanmean(amt) if total_charges > 0 else np.nan,
+            'median_amount': np.nanmedian(amt) if total_charges > 0 else np.nan,
+            'total_monthly_rent': np.nansum(amt)
+        }
+    
+    def _active_amendments(self, amendments_file: str) -> pd.DataFrame:
+        """Activated/Superseded amendments, filtered once per file"""
+        key = ('active_amendments', amendments_file)
+        with self._load_lock:
+            if key not in self._derived:
+                amendments_df = self._load(amendments_file)
+                self._derived[key] = amendments_df[self._status_mask(amendments_df['amendment status'], self._ACTIVE_STATUSES)]
+            return self._derived[key]
+    
+    def _charge_hmy_index(self, charges_file: str) -> pd.Index:
+        """Unique amendment ids that have a charge schedule, built once per file"""
+        key = ('charge_hmy', charges_file)
+        with self._load_lock:
+            if key not in self._derived:
+                self._derived[key] = pd.Index(self._load(charges_file)['amendment hmy'].unique())
+            return self._derived[key]
+    
+    def _shared_inputs(self) -> Dict[str, Any]:
+        """Active amendments and charge id index shared by a category's subtests"""
+        # On missing files or read errors return nothing, so each subtest
+        # loads its own inputs and reports the problem itself
+        amendments_file = self._paths['amendments']
+        charges_file = self._paths['charges']
+        
+        try:
+            if not self._file_exists(amendments_file) or not self._file_exists(charges_file):
+                return {}
+            return {
+                'active_amendments': self._active_amendments(amendments_file),
+                'charge_hmy': self._charge_hmy_index(charges_file)
+            }
+        except Exception:
+            return {}
+    
     def run_comprehensive_accuracy_validation(self) -> Dict[str, Any]:
         """Run comprehensive accuracy validation addressing Fund 2 issues"""
         logger.info("🎯 Starting Enhanced Accuracy Validation - Fund 2 Critical Issues Focus")
+        self._current_date = datetime.now()
+        # Files may have been added or removed since the last run; list directories afresh
+        self._dir_listings.clear()
         
         validation_results = {
             'overall_status': 'UNKNOWN',
@@ -102,15 +408,24 @@ class EnhancedAccuracyValidator:
             ('edge_case_handling', self._validate_edge_cases)
         ]
         
-        for category, test_method in test_categories:
-            try:
+        # Categories are independent and share the CSV cache, so run them on a
+        # thread pool and collect results in the original category order. Each
+        # category runs its own tests in sequence, so this pool bounds concurrency
+        max_workers = min(len(test_categories), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = []
+            for category, test_method in test_categories:
                 logger.info(f"🔍 Running {category} validation tests...")
-                category_results = test_method()
-                validation_results['tests'].extend(category_results)
-            except Exception as e:
-                logger.error(f"Error in {category} validation: {e}")
-                error_result = self._create_error_result(category, str(e))
-                validation_results['tests'].append(error_result)
+                futures.append((category, executor.submit(test_method)))
+            
+            for category, future in futures:
+                try:
+                    category_results = future.result()
+                    validation_results['tests'].extend(category_results)
+                except Exception as e:
+                    logger.error(f"Error in {category} validation: {e}")
+                    error_result = self._create_error_result(category, str(e))
+                    validation_results['tests'].append(error_result)
         
         # Calculate overall results
         validation_results = self._calculate_overall_results(validation_results)
@@ -126,292 +441,269 @@ class EnhancedAccuracyValidator:
     def _validate_amendment_selection_logic(self) -> List[AccuracyTestResult]:
         """Validate the critical 'latest amendment WITH charges' logic"""
         results = []
+        shared = self._shared_inputs()
         
         # Test 1: Latest Amendment Selection Accuracy
-        result = self._test_latest_amendment_selection()
+        result = self._test_latest_amendment_selection(**shared)
         results.append(result)
         
         # Test 2: Amendment WITH Charges Logic
-        result = self._test_amendment_with_charges_logic()
+        result = self._test_amendment_with_charges_logic(shared.get('active_amendments'))
         results.append(result)
         
         # Test 3: Sequence Priority Logic
-        result = self._test_sequence_priority_logic()
+        result = self._test_sequence_priority_logic(**shared)
         results.append(result)
         
         return results
     
-    def _test_latest_amendment_selection(self) -> AccuracyTestResult:
+    @_accuracy_test("Latest Amendment Selection")
+    def _test_latest_amendment_selection(self, active_amendments: Optional[pd.DataFrame] = None, charge_hmy: Optional[pd.Index] = None) -> AccuracyTestResult:
         """Test if latest amendment selection logic works correctly"""
-        start_time = datetime.now()
+        amendments_file = self._paths['amendments']
+        charges_file = self._paths['charges']
+        
+        missing = self._require("Latest Amendment Selection", [amendments_file, charges_file])
+        if missing:
+            return missing
+        
+        if charge_hmy is None:
+            charge_hmy = self._charge_hmy_index(charges_file)
+        
+        # Filter to active amendment statuses
+        if active_amendments is None:
+            active_amendments = self._active_amendments(amendments_file)
+        
+        # Latest amendment by sequence for each property/tenant, and whether it has charges
+        latest_pos, has_charges = _latest_with_charges(
+            active_amendments['property hmy'].to_numpy(),
+            active_amendments['tenant hmy'].to_numpy(),
+            active_amendments['amendment sequence'].to_numpy(),
+            active_amendments['amendment hmy'].to_numpy(),
+            charge_hmy.to_numpy()
+        )
+        latest_df = active_amendments.iloc[latest_pos][
+            ['property hmy', 'tenant hmy', 'amendment sequence', 'amendment status', 'amendment hmy']
+        ]
         
-        try:
-            amendments_file = f"{self.data_path}/Fund2_Filtered/dim_fp_amendmentsunitspropertytenant_fund2.csv"
-            charges_file = f"{self.data_path}/Fund2_Filtered/dim_fp_amendmentchargeschedule_fund2_active.csv"
-            
-            if not os.path.exists(amendments_file) or not os.path.exists(charges_file):
-                return self._create_file_missing_result("Latest Amendment Selection", [amendments_file, charges_file])
-            
-            amendments_df = pd.read_csv(amendments_file)
-            charges_df = pd.read_csv(charges_file)
-            
-            # Filter to active amendment statuses
-            active_statuses = ['Activated', 'Superseded']
-            active_amendments = amendments_df[
-                amendments_df['amendment status'].isin(active_statuses)
-            ].copy()
-            
-            # Group by property/tenant and get latest sequences
-            grouped = active_amendments.groupby(['property hmy', 'tenant hmy'])
-            
-            correct_selections = 0
-            total_combinations = len(grouped)
-            missing_charges_count = 0
-            selection_details = []
-            
-            for (prop_hmy, tenant_hmy), group in grouped:
-                # Get the latest amendment by sequence
-                latest_amendment = group.loc[group['amendment sequence'].idxmax()]
-                
-                # Check if this latest amendment has charges
-                has_charges = latest_amendment['amendment hmy'] in charges_df['amendment hmy'].values
-                
-                selection_details.append({
-                    'property_hmy': prop_hmy,
-                    'tenant_hmy': tenant_hmy,
-                    'latest_sequence': latest_amendment['amendment sequence'],
-                    'latest_status': latest_amendment['amendment status'],
-                    'has_charges': has_charges,
-                    'amendment_hmy': latest_amendment['amendment hmy']
-                })
-                
-                if has_charges:
-                    correct_selections += 1
-                else:
-                    missing_charges_count += 1
-            
-            # Calculate accuracy
-            selection_accuracy = (correct_selections / total_combinations * 100) if total_combinations > 0 else 0
-            
-            # Determine status
-            status = "PASS" if selection_accuracy >= 90.0 else "WARNING" if selection_accuracy >= 75.0 else "FAIL"
-            
-            # Critical issues
-            critical_issues = []
-            if missing_charges_count > (total_combinations * 0.1):  # >10% missing charges
-                critical_issues.append(f"High missing charges rate: {missing_charges_count:,} of {total_combinations:,} ({missing_charges_count/total_combinations*100:.1f}%)")
-            
-            if selection_accuracy < 90.0:
-                critical_issues.append(f"Amendment selection accuracy {selection_accuracy:.1f}% below 90% target")
-            
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            return AccuracyTestResult(
-                test_id="AMN_SEL_001",
-                test_name="Latest Amendment Selection Logic",
-                category="Amendment Selection",
-                target_accuracy=90.0,
-                actual_accuracy=selection_accuracy,
-                variance_amount=missing_charges_count,
-                variance_pct=(missing_charges_count / total_combinations * 100) if total_combinations > 0 else 0,
-                status=status,
-                critical_issues=critical_issues,
-                recommendations=self._generate_amendment_selection_recommendations(selection_accuracy, missing_charges_count),
-                detailed_metrics={
-                    'total_combinations': total_combinations,
-                    'correct_selections': correct_selections,
-                    'missing_charges_count': missing_charges_count,
-                    'selection_accuracy': selection_accuracy,
-                    'sample_selections': selection_details[:20]  # First 20 for inspection
-                },
-                execution_time=execution_time,
-                timestamp=start_time
-            )
-            
-        except Exception as e:
-            return self._create_error_result("Latest Amendment Selection", str(e))
+        total_combinations = len(latest_df)
+        correct_selections = int(has_charges.sum())
+        missing_charges_count = total_combinations - correct_selections
+        
+        selection_details = latest_df.head(20).assign(has_charges=has_charges[:20]).rename(columns={
+            'property hmy': 'property_hmy',
+            'tenant hmy': 'tenant_hmy',
+            'amendment sequence': 'latest_sequence',
+            'amendment status': 'latest_status',
+            'amendment hmy': 'amendment_hmy'
+        }).to_dict('records')
+        
+        # Calculate accuracy
+        selection_accuracy = (correct_selections / total_combinations * 100) if total_combinations > 0 else 0
+        
+        # Determine status
+        status = "PASS" if selection_accuracy >= 90.0 else "WARNING" if selection_accuracy >= 75.0 else "FAIL"
+        
+        # Critical issues
+        critical_issues = []
+        if missing_charges_count > (total_combinations * 0.1):  # >10% missing charges
+            critical_issues.append(f"High missing charges rate: {missing_charges_count:,} of {total_combinations:,} ({missing_charges_count/total_combinations*100:.1f}%)")
+        
+        if selection_accuracy < 90.0:
+            critical_issues.append(f"Amendment selection accuracy {selection_accuracy:.1f}% below 90% target")
+        
+        return AccuracyTestResult(
+            test_id="AMN_SEL_001",
+            test_name="Latest Amendment Selection Logic",
+            category="Amendment Selection",
+            target_accuracy=90.0,
+            actual_accuracy=selection_accuracy,
+            variance_amount=missing_charges_count,
+            variance_pct=(missing_charges_count / total_combinations * 100) if total_combinations > 0 else 0,
+            status=status,
+            critical_issues=critical_issues,
+            recommendations=self._generate_amendment_selection_recommendations(selection_accuracy, missing_charges_count),
+            detailed_metrics={
+                'total_combinations': total_combinations,
+                'correct_selections': correct_selections,
+                'missing_charges_count': missing_charges_count,
+                'selection_accuracy': selection_accuracy,
+                'sample_selections': selection_details  # First 20 for inspection
+            },
+            execution_time=0.0,
+            timestamp=None
+        )
     
-    def _test_amendment_with_charges_logic(self) -> AccuracyTestResult:
+    @_accuracy_test("Amendment WITH Charges Logic")
+    def _test_amendment_with_charges_logic(self, active_amendments: Optional[pd.DataFrame] = None) -> AccuracyTestResult:
         """Test the amendment WITH charges logic critical to Fund 2 accuracy"""
-        start_time = datetime.now()
+        amendments_file = self._paths['amendments']
+        charges_file = self._paths['charges']
         
-        try:
-            amendments_file = f"{self.data_path}/Fund2_Filtered/dim_fp_amendmentsunitspropertytenant_fund2.csv"
-            charges_file = f"{self.data_path}/Fund2_Filtered/dim_fp_amendmentchargeschedule_fund2_active.csv"
-            
-            if not os.path.exists(amendments_file) or not os.path.exists(charges_file):
-                return self._create_file_missing_result("Amendment WITH Charges Logic", [amendments_file, charges_file])
-            
-            amendments_df = pd.read_csv(amendments_file)
-            charges_df = pd.read_csv(charges_file)
-            
-            # Create the "amendment WITH charges" logic test
-            active_statuses = ['Activated', 'Superseded']
-            active_amendments = amendments_df[
-                amendments_df['amendment status'].isin(active_statuses)
-            ].copy()
-            
-            # Inner join amendments with charges (WITH charges logic)
-            amendments_with_charges = active_amendments.merge(
-                charges_df[['amendment hmy', 'amount']].groupby('amendment hmy').agg({
-                    'amount': 'sum'
-                }).reset_index(),
-                on='amendment hmy',
-                how='inner'
-            )
-            
-            # Calculate metrics
-            total_active_amendments = len(active_amendments)
-            amendments_with_charges_count = len(amendments_with_charges)
-            total_rent_with_charges = amendments_with_charges['amount'].sum() if 'amount' in amendments_with_charges.columns else 0
-            
-            # Get property/tenant combinations WITH charges
-            combinations_with_charges = amendments_with_charges.groupby(['property hmy', 'tenant hmy']).size().count()
-            total_combinations = active_amendments.groupby(['property hmy', 'tenant hmy']).size().count()
-            
-            # Calculate charge integration rate (critical metric)
-            charge_integration_rate = (combinations_with_charges / total_combinations * 100) if total_combinations > 0 else 0
-            
-            # Determine status based on Fund 2 targets
-            status = "PASS" if charge_integration_rate >= 98.0 else "WARNING" if charge_integration_rate >= 95.0 else "FAIL"
-            
-            # Critical issues for Fund 2
-            critical_issues = []
-            if charge_integration_rate < 98.0:
-                missing_integration = 98.0 - charge_integration_rate
-                critical_issues.append(f"Charge integration {charge_integration_rate:.1f}% below 98% target (missing {missing_integration:.1f}%)")
-            
-            if total_rent_with_charges == 0:
-                critical_issues.append("No rent amounts found in charge integration - data quality issue")
-            
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            return AccuracyTestResult(
-                test_id="AMN_CHG_001",
-                test_name="Amendment WITH Charges Logic",
-                category="Amendment Selection",
-                target_accuracy=98.0,
-                actual_accuracy=charge_integration_rate,
-                variance_amount=total_combinations - combinations_with_charges,
-                variance_pct=100 - charge_integration_rate,
-                status=status,
-                critical_issues=critical_issues,
-                recommendations=self._generate_charge_integration_recommendations(charge_integration_rate),
-                detailed_metrics={
-                    'total_active_amendments': total_active_amendments,
-                    'amendments_with_charges_count': amendments_with_charges_count,
-                    'total_combinations': total_combinations,
-                    'combinations_with_charges': combinations_with_charges,
-                    'charge_integration_rate': charge_integration_rate,
-                    'total_rent_with_charges': total_rent_with_charges,
-                    'missing_integrations': total_combinations - combinations_with_charges
-                },
-                execution_time=execution_time,
-                timestamp=start_time
-            )
-            
-        except Exception as e:
-            return self._create_error_result("Amendment WITH Charges Logic", str(e))
+        missing = self._require("Amendment WITH Charges Logic", [amendments_file, charges_file])
+        if missing:
+            return missing
+        
+        # Create the "amendment WITH charges" logic test
+        if active_amendments is None:
+            active_amendments = self._active_amendments(amendments_file)
+        
+        # Summed charges per active amendment; unmatched amendments map to NaN (WITH charges logic)
+        charge_sum = self._charge_sums(charges_file)
+        amendment_amounts = active_amendments['amendment hmy'].map(charge_sum)
+        has_charges = amendment_amounts.notna()
+        
+        # Calculate metrics
+        total_active_amendments = len(active_amendments)
+        amendments_with_charges_count = int(has_charges.sum())
+        total_rent_with_charges = float(amendment_amounts.sum())
+        
+        # Get property/tenant combinations WITH charges
+        combinations_with_charges = self._n_unique_pairs(active_amendments[has_charges])
+        total_combinations = self._n_unique_pairs(active_amendments)
+        
+        # Calculate charge integration rate (critical metric)
+        charge_integration_rate = (combinations_with_charges / total_combinations * 100) if total_combinations > 0 else 0
+        
+        # Determine status based on Fund 2 targets
+        status = "PASS" if charge_integration_rate >= 98.0 else "WARNING" if charge_integration_rate >= 95.0 else "FAIL"
+        
+        # Critical issues for Fund 2
+        critical_issues = []
+        if charge_integration_rate < 98.0:
+            missing_integration = 98.0 - charge_integration_rate
+            critical_issues.append(f"Charge integration {charge_integration_rate:.1f}% below 98% target (missing {missing_integration:.1f}%)")
+        
+        if total_rent_with_charges == 0:
+            critical_issues.append("No rent amounts found in charge integration - data quality issue")
+        
+        return AccuracyTestResult(
+            test_id="AMN_CHG_001",
+            test_name="Amendment WITH Charges Logic",
+            category="Amendment Selection",
+            target_accuracy=98.0,
+            actual_accuracy=charge_integration_rate,
+            variance_amount=total_combinations - combinations_with_charges,
+            variance_pct=100 - charge_integration_rate,
+            status=status,
+            critical_issues=critical_issues,
+            recommendations=self._generate_charge_integration_recommendations(charge_integration_rate),
+            detailed_metrics={
+                'total_active_amendments': total_active_amendments,
+                'amendments_with_charges_count': amendments_with_charges_count,
+                'total_combinations': total_combinations,
+                'combinations_with_charges': combinations_with_charges,
+                'charge_integration_rate': charge_integration_rate,
+                'total_rent_with_charges': total_rent_with_charges,
+                'missing_integrations': total_combinations - combinations_with_charges
+            },
+            execution_time=0.0,
+            timestamp=None
+        )
     
-    def _test_sequence_priority_logic(self) -> AccuracyTestResult:
+    @_accuracy_test("Sequence Priority Logic")
+    def _test_sequence_priority_logic(self, active_amendments: Optional[pd.DataFrame] = None, charge_hmy: Optional[pd.Index] = None) -> AccuracyTestResult:
         """Test sequence priority logic (Activated vs Superseded with charges)"""
-        start_time = datetime.now()
+        amendments_file = self._paths['amendments']
+        charges_file = self._paths['charges']
         
-        try:
-            amendments_file = f"{self.data_path}/Fund2_Filtered/dim_fp_amendmentsunitspropertytenant_fund2.csv"
-            charges_file = f"{self.data_path}/Fund2_Filtered/dim_fp_amendmentchargeschedule_fund2_active.csv"
-            
-            if not os.path.exists(amendments_file) or not os.path.exists(charges_file):
-                return self._create_file_missing_result("Sequence Priority Logic", [amendments_file, charges_file])
-            
-            amendments_df = pd.read_csv(amendments_file)
-            charges_df = pd.read_csv(charges_file)
-            
-            # Find cases where both Activated and Superseded exist for same property/tenant
-            active_statuses = ['Activated', 'Superseded']
-            active_amendments = amendments_df[
-                amendments_df['amendment status'].isin(active_statuses)
-            ].copy()
-            
-            priority_test_cases = 0
-            correct_priority_selections = 0
-            priority_details = []
-            
-            # Group by property/tenant and check for status conflicts
-            for (prop_hmy, tenant_hmy), group in active_amendments.groupby(['property hmy', 'tenant hmy']):
-                if len(group['amendment status'].unique()) > 1:  # Multiple statuses
-                    priority_test_cases += 1
-                    
-                    # Get latest amendment per status
-                    latest_per_status = group.loc[group.groupby('amendment status')['amendment sequence'].idxmax()]
-                    
-                    # Check which ones have charges
-                    with_charges = latest_per_status[
-                        latest_per_status['amendment hmy'].isin(charges_df['amendment hmy'])
-                    ]
-                    
-                    # Priority logic: Activated > Superseded (if both have charges)
-                    if len(with_charges) > 0:
-                        if 'Activated' in with_charges['amendment status'].values:
-                            selected_status = 'Activated'
-                        else:
-                            selected_status = 'Superseded'
-                        
-                        correct_priority_selections += 1
-                    
-                    priority_details.append({
-                        'property_hmy': prop_hmy,
-                        'tenant_hmy': tenant_hmy,
-                        'statuses_available': group['amendment status'].tolist(),
-                        'statuses_with_charges': with_charges['amendment status'].tolist(),
-                        'priority_selection': selected_status if len(with_charges) > 0 else None
-                    })
-            
-            # Calculate priority accuracy
-            priority_accuracy = (correct_priority_selections / priority_test_cases * 100) if priority_test_cases > 0 else 100
-            
-            status = "PASS" if priority_accuracy >= 95.0 else "WARNING" if priority_accuracy >= 90.0 else "FAIL"
-            
-            critical_issues = []
-            if priority_accuracy < 95.0:
-                critical_issues.append(f"Priority logic accuracy {priority_accuracy:.1f}% below 95% target")
-            
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            return AccuracyTestResult(
-                test_id="SEQ_PRI_001",
-                test_name="Sequence Priority Logic (Activated vs Superseded)",
-                category="Amendment Selection",
-                target_accuracy=95.0,
-                actual_accuracy=priority_accuracy,
-                variance_amount=priority_test_cases - correct_priority_selections,
-                variance_pct=100 - priority_accuracy,
-                status=status,
-                critical_issues=critical_issues,
-                recommendations=[
-                    "Implement Activated > Superseded priority when both have charges",
-                    "Exclude amendments without charges from priority consideration",
-                    "Test priority logic with edge cases"
-                ] if priority_accuracy < 95.0 else ["Priority logic working correctly"],
-                detailed_metrics={
-                    'priority_test_cases': priority_test_cases,
-                    'correct_priority_selections': correct_priority_selections,
-                    'priority_accuracy': priority_accuracy,
-                    'priority_details': priority_details[:10]  # Sample for review
-                },
-                execution_time=execution_time,
-                timestamp=start_time
-            )
+        missing = self._require("Sequence Priority Logic", [amendments_file, charges_file])
+        if missing:
+            return missing
+        
+        if charge_hmy is None:
+            charge_hmy = self._charge_hmy_index(charges_file)
+        
+        # Find cases where both Activated and Superseded exist for same property/tenant
+        if active_amendments is None:
+            active_amendments = self._active_amendments(amendments_file)
+        
+        pair_cols = ['property hmy', 'tenant hmy']
+        
+        # Property/tenant pairs carrying more than one status
+        status_counts = active_amendments.groupby(pair_cols, sort=False)['amendment status'].transform('nunique')
+        multi_status = active_amendments[status_counts > 1]
+        
+        # Latest amendment per pair and status, and whether it has charges
+        latest_idx = multi_status.groupby(pair_cols + ['amendment status'], observed=True)['amendment sequence'].idxmax()
+        latest_per_status = multi_status.loc[latest_idx]
+        has_charges = latest_per_status['amendment hmy'].isin(charge_hmy)
+        
+        # A pair is resolvable when any of its latest-per-status amendments has charges
+        pair_has_charges = has_charges.groupby([latest_per_status[col] for col in pair_cols]).any()
+        priority_test_cases = len(pair_has_charges)
+        correct_priority_selections = int(pair_has_charges.sum())
+        
+        # Detail rows for the first 10 test cases only
+        sample_pairs = pair_has_charges.index[:10]
+        sample_rows = multi_status[pd.MultiIndex.from_frame(multi_status[pair_cols]).isin(sample_pairs)]
+        sample_latest = latest_per_status[
+            has_charges & pd.MultiIndex.from_frame(latest_per_status[pair_cols]).isin(sample_pairs)
+        ]
+        statuses_available = sample_rows.groupby(pair_cols)['amendment status'].apply(list)
+        statuses_with_charges = sample_latest.groupby(pair_cols)['amendment status'].apply(list)
+        
+        priority_details = []
+        for prop_hmy, tenant_hmy in sample_pairs:
+            with_charges = statuses_with_charges.get((prop_hmy, tenant_hmy), [])
+            
+            # Priority logic: Activated > Superseded (if both have charges)
+            if 'Activated' in with_charges:
+                selected_status = 'Activated'
+            elif with_charges:
+                selected_status = 'Superseded'
+            else:
+                selected_status = None
             
-        except Exception as e:
-            return self._create_error_result("Sequence Priority Logic", str(e))
+            priority_details.append({
+                'property_hmy': prop_hmy,
+                'tenant_hmy': tenant_hmy,
+                'statuses_available': statuses_available[(prop_hmy, tenant_hmy)],
+                'statuses_with_charges': with_charges,
+                'priority_selection': selected_status
+            })
+        
+        # Calculate priority accuracy
+        priority_accuracy = (correct_priority_selections / priority_test_cases * 100) if priority_test_cases > 0 else 100
+        
+        status = "PASS" if priority_accuracy >= 95.0 else "WARNING" if priority_accuracy >= 90.0 else "FAIL"
+        
+        critical_issues = []
+        if priority_accuracy < 95.0:
+            critical_issues.append(f"Priority logic accuracy {priority_accuracy:.1f}% below 95% target")
+        
+        return AccuracyTestResult(
+            test_id="SEQ_PRI_001",
+            test_name="Sequence Priority Logic (Activated vs Superseded)",
+            category="Amendment Selection",
+            target_accuracy=95.0,
+            actual_accuracy=priority_accuracy,
+            variance_amount=priority_test_cases - correct_priority_selections,
+            variance_pct=100 - priority_accuracy,
+            status=status,
+            critical_issues=critical_issues,
+            recommendations=[
+                "Implement Activated > Superseded priority when both have charges",
+                "Exclude amendments without charges from priority consideration",
+                "Test priority logic with edge cases"
+            ] if priority_accuracy < 95.0 else ["Priority logic working correctly"],
+            detailed_metrics={
+                'priority_test_cases': priority_test_cases,
+                'correct_priority_selections': correct_priority_selections,
+                'priority_accuracy': priority_accuracy,
+                'priority_details': priority_details  # First 10 for review
+            },
+            execution_time=0.0,
+            timestamp=None
+        )
     
     def _validate_charge_integration(self) -> List[AccuracyTestResult]:
         """Validate charge schedule integration accuracy"""
         results = []
+        shared = self._shared_inputs()
         
         # Test 1: Charge Schedule Completeness
-        result = self._test_charge_schedule_completeness()
+        result = self._test_charge_schedule_completeness(**shared)
         results.append(result)
         
         # Test 2: Charge Amount Accuracy
@@ -424,461 +716,414 @@ class EnhancedAccuracyValidator:
         
         return results
     
-    def _test_charge_schedule_completeness(self) -> AccuracyTestResult:
+    @_accuracy_test("Charge Schedule Completeness")
+    def _test_charge_schedule_completeness(self, active_amendments: Optional[pd.DataFrame] = None, charge_hmy: Optional[pd.Index] = None) -> AccuracyTestResult:
         """Test charge schedule completeness vs amendments"""
-        start_time = datetime.now()
+        amendments_file = self._paths['amendments']
+        charges_file = self._paths['charges']
         
-        try:
-            amendments_file = f"{self.data_path}/Fund2_Filtered/dim_fp_amendmentsunitspropertytenant_fund2.csv"
-            charges_file = f"{self.data_path}/Fund2_Filtered/dim_fp_amendmentchargeschedule_fund2_active.csv"
-            
-            if not os.path.exists(amendments_file) or not os.path.exists(charges_file):
-                return self._create_file_missing_result("Charge Schedule Completeness", [amendments_file, charges_file])
-            
-            amendments_df = pd.read_csv(amendments_file)
-            charges_df = pd.read_csv(charges_file)
-            
-            # Active amendments that should have charges
-            active_statuses = ['Activated', 'Superseded']
-            active_amendments = amendments_df[
-                amendments_df['amendment status'].isin(active_statuses)
-            ]
-            
-            # Exclude "Proposal in DM" and other non-active types  
-            exclude_statuses = ['Proposal in DM', 'Terminated', 'Expired', 'Draft']
-            filtered_amendments = active_amendments[
-                ~active_amendments['amendment status'].isin(exclude_statuses)
-            ]
-            
-            # Calculate completeness metrics
-            total_amendments = len(filtered_amendments)
-            amendments_with_charges = len(filtered_amendments[
-                filtered_amendments['amendment hmy'].isin(charges_df['amendment hmy'])
-            ])
-            
-            completeness_rate = (amendments_with_charges / total_amendments * 100) if total_amendments > 0 else 0
-            
-            # Fund 2 target: 98%+ charge completeness
-            status = "PASS" if completeness_rate >= 98.0 else "WARNING" if completeness_rate >= 95.0 else "FAIL"
-            
-            critical_issues = []
-            if completeness_rate < 98.0:
-                missing_charges = total_amendments - amendments_with_charges
-                critical_issues.append(f"Charge completeness {completeness_rate:.1f}% below 98% target ({missing_charges:,} missing)")
-            
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            return AccuracyTestResult(
-                test_id="CHG_CMP_001",
-                test_name="Charge Schedule Completeness",
-                category="Charge Integration",
-                target_accuracy=98.0,
-                actual_accuracy=completeness_rate,
-                variance_amount=total_amendments - amendments_with_charges,
-                variance_pct=100 - completeness_rate,
-                status=status,
-                critical_issues=critical_issues,
-                recommendations=[
-                    "Review charge extraction process for missing schedules",
-                    "Implement charge validation rules",
-                    "Focus on Activated/Superseded amendments with missing charges"
-                ] if completeness_rate < 98.0 else ["Charge completeness meets target"],
-                detailed_metrics={
-                    'total_amendments': total_amendments,
-                    'amendments_with_charges': amendments_with_charges,
-                    'completeness_rate': completeness_rate,
-                    'missing_charges': total_amendments - amendments_with_charges
-                },
-                execution_time=execution_time,
-                timestamp=start_time
-            )
-            
-        except Exception as e:
-            return self._create_error_result("Charge Schedule Completeness", str(e))
+        missing = self._require("Charge Schedule Completeness", [amendments_file, charges_file])
+        if missing:
+            return missing
+        
+        if charge_hmy is None:
+            charge_hmy = self._charge_hmy_index(charges_file)
+        
+        # Active amendments that should have charges
+        if active_amendments is None:
+            active_amendments = self._active_amendments(amendments_file)
+        
+        # Exclude "Proposal in DM" and other non-active types  
+        exclude_statuses = ['Proposal in DM', 'Terminated', 'Expired', 'Draft']
+        keep = ~active_amendments['amendment status'].isin(exclude_statuses)
+        
+        # Calculate completeness metrics
+        total_amendments = int(keep.sum())
+        amendments_with_charges = self._count_with_charges(active_amendments['amendment hmy'][keep], charge_hmy)
+        
+        completeness_rate = (amendments_with_charges / total_amendments * 100) if total_amendments > 0 else 0
+        
+        # Fund 2 target: 98%+ charge completeness
+        status = "PASS" if completeness_rate >= 98.0 else "WARNING" if completeness_rate >= 95.0 else "FAIL"
+        
+        critical_issues = []
+        if completeness_rate < 98.0:
+            missing_charges = total_amendments - amendments_with_charges
+            critical_issues.append(f"Charge completeness {completeness_rate:.1f}% below 98% target ({missing_charges:,} missing)")
+        
+        return AccuracyTestResult(
+            test_id="CHG_CMP_001",
+            test_name="Charge Schedule Completeness",
+            category="Charge Integration",
+            target_accuracy=98.0,
+            actual_accuracy=completeness_rate,
+            variance_amount=total_amendments - amendments_with_charges,
+            variance_pct=100 - completeness_rate,
+            status=status,
+            critical_issues=critical_issues,
+            recommendations=[
+                "Review charge extraction process for missing schedules",
+                "Implement charge validation rules",
+                "Focus on Activated/Superseded amendments with missing charges"
+            ] if completeness_rate < 98.0 else ["Charge completeness meets target"],
+            detailed_metrics={
+                'total_amendments': total_amendments,
+                'amendments_with_charges': amendments_with_charges,
+                'completeness_rate': completeness_rate,
+                'missing_charges': total_amendments - amendments_with_charges
+            },
+            execution_time=0.0,
+            timestamp=None
+        )
     
+    @_accuracy_test("Charge Amount Accuracy")
     def _test_charge_amount_accuracy(self) -> AccuracyTestResult:
         """Test charge amount calculation accuracy"""
-        start_time = datetime.now()
+        charges_file = self._paths['charges']
         
-        try:
-            charges_file = f"{self.data_path}/Fund2_Filtered/dim_fp_amendmentchargeschedule_fund2_active.csv"
-            
-            if not os.path.exists(charges_file):
-                return self._create_file_missing_result("Charge Amount Accuracy", [charges_file])
-            
-            charges_df = pd.read_csv(charges_file)
-            
-            # Analyze charge amounts for accuracy indicators
-            total_charges = len(charges_df)
-            accuracy_issues = 0
-            amount_details = {}
-            
-            if 'amount' in charges_df.columns:
-                # Check for common accuracy issues
-                negative_amounts = (charges_df['amount'] < 0).sum()
-                zero_amounts = (charges_df['amount'] == 0).sum()
-                extreme_amounts = (charges_df['amount'] > 50000).sum()  # >$50k/month
-                
-                accuracy_issues = negative_amounts + zero_amounts + extreme_amounts
-                
-                amount_details = {
-                    'total_charges': total_charges,
-                    'negative_amounts': negative_amounts,
-                    'zero_amounts': zero_amounts,
-                    'extreme_amounts': extreme_amounts,
-                    'mean_amount': charges_df['amount'].mean(),
-                    'median_amount': charges_df['amount'].median(),
-                    'total_monthly_rent': charges_df['amount'].sum()
-                }
-            
-            # Calculate accuracy rate
-            accuracy_rate = ((total_charges - accuracy_issues) / total_charges * 100) if total_charges > 0 else 100
-            
-            status = "PASS" if accuracy_rate >= 95.0 else "WARNING" if accuracy_rate >= 90.0 else "FAIL"
-            
-            critical_issues = []
-            if accuracy_rate < 95.0:
-                critical_issues.append(f"Charge amount accuracy {accuracy_rate:.1f}% below 95% target")
-            if negative_amounts > 0:
-                critical_issues.append(f"{negative_amounts:,} negative charge amounts found")
-            
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            return AccuracyTestResult(
-                test_id="CHG_AMT_001",
-                test_name="Charge Amount Accuracy",
-                category="Charge Integration",
-                target_accuracy=95.0,
-                actual_accuracy=accuracy_rate,
-                variance_amount=accuracy_issues,
-                variance_pct=100 - accuracy_rate,
-                status=status,
-                critical_issues=critical_issues,
-                recommendations=[
-                    "Review negative charge amounts for data entry errors",
-                    "Investigate zero-amount charges", 
-                    "Validate extreme charge amounts",
-                    "Implement charge amount validation rules"
-                ] if accuracy_rate < 95.0 else ["Charge amounts within expected range"],
-                detailed_metrics=amount_details,
-                execution_time=execution_time,
-                timestamp=start_time
-            )
-            
-        except Exception as e:
-            return self._create_error_result("Charge Amount Accuracy", str(e))
+        missing = self._require("Charge Amount Accuracy", [charges_file])
+        if missing:
+            return missing
+        
+        # Analyze charge amounts for accuracy indicators
+        if self.chunksize:
+            frames = self._iter_chunks(charges_file, ['amendment hmy', 'amount'])
+        else:
+            frames = [self._load(charges_file)]
+        total_charges, amount_details = self._summarize_charge_amounts(frames)
+        
+        negative_amounts = amount_details.get('negative_amounts', 0)
+        accuracy_issues = negative_amounts + amount_details.get('zero_amounts', 0) + amount_details.get('extreme_amounts', 0)
+        
+        # Calculate accuracy rate
+        accuracy_rate = ((total_charges - accuracy_issues) / total_charges * 100) if total_charges > 0 else 100
+        
+        status = "PASS" if accuracy_rate >= 95.0 else "WARNING" if accuracy_rate >= 90.0 else "FAIL"
+        
+        critical_issues = []
+        if accuracy_rate < 95.0:
+            critical_issues.append(f"Charge amount accuracy {accuracy_rate:.1f}% below 95% target")
+        if negative_amounts > 0:
+            critical_issues.append(f"{negative_amounts:,} negative charge amounts found")
+        
+        return AccuracyTestResult(
+            test_id="CHG_AMT_001",
+            test_name="Charge Amount Accuracy",
+            category="Charge Integration",
+            target_accuracy=95.0,
+            actual_accuracy=accuracy_rate,
+            variance_amount=accuracy_issues,
+            variance_pct=100 - accuracy_rate,
+            status=status,
+            critical_issues=critical_issues,
+            recommendations=[
+                "Review negative charge amounts for data entry errors",
+                "Investigate zero-amount charges", 
+                "Validate extreme charge amounts",
+                "Implement charge amount validation rules"
+            ] if accuracy_rate < 95.0 else ["Charge amounts within expected range"],
+            detailed_metrics=amount_details,
+            execution_time=0.0,
+            timestamp=None
+        )
     
+    @_accuracy_test("Charge Type Distribution")
     def _test_charge_type_distribution(self) -> AccuracyTestResult:
         """Test charge type distribution for business logic compliance"""
-        start_time = datetime.now()
+        charges_file = self._paths['charges']
         
-        try:
-            charges_file = f"{self.data_path}/Fund2_Filtered/dim_fp_amendmentchargeschedule_fund2_active.csv"
-            
-            if not os.path.exists(charges_file):
-                return self._create_file_missing_result("Charge Type Distribution", [charges_file])
-            
-            charges_df = pd.read_csv(charges_file)
-            
-            # Analyze charge type distribution if available
-            charge_type_analysis = {}
-            if 'charge_type' in charges_df.columns:
-                charge_types = charges_df['charge_type'].value_counts()
-                charge_type_analysis = charge_types.to_dict()
-            elif 'description' in charges_df.columns:
-                # Use description as proxy for charge type
-                descriptions = charges_df['description'].value_counts()
-                charge_type_analysis = descriptions.head(10).to_dict()
-            
-            # Basic distribution health check
-            total_charges = len(charges_df)
-            unique_types = len(charge_type_analysis)
-            
-            # Health score based on diversity (expect rent, CAM, insurance, etc.)
-            expected_min_types = 3  # At least rent, CAM, other
-            distribution_health = min(100, (unique_types / expected_min_types) * 100)
-            
-            status = "PASS" if distribution_health >= 80 else "WARNING" if distribution_health >= 60 else "FAIL"
-            
-            critical_issues = []
-            if unique_types < expected_min_types:
-                critical_issues.append(f"Only {unique_types} charge types found, expected at least {expected_min_types}")
-            
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            return AccuracyTestResult(
-                test_id="CHG_TYP_001",
-                test_name="Charge Type Distribution",
-                category="Charge Integration",
-                target_accuracy=80.0,
-                actual_accuracy=distribution_health,
-                variance_amount=expected_min_types - unique_types,
-                variance_pct=100 - distribution_health,
-                status=status,
-                critical_issues=critical_issues,
-                recommendations=[
-                    "Review charge type classification",
-                    "Ensure all charge types are captured",
-                    "Validate charge type mapping from source system"
-                ] if distribution_health < 80 else ["Charge type distribution appears healthy"],
-                detailed_metrics={
-                    'total_charges': total_charges,
-                    'unique_types': unique_types,
-                    'distribution_health': distribution_health,
-                    'charge_type_breakdown': charge_type_analysis
-                },
-                execution_time=execution_time,
-                timestamp=start_time
-            )
-            
-        except Exception as e:
-            return self._create_error_result("Charge Type Distribution", str(e))
+        missing = self._require("Charge Type Distribution", [charges_file])
+        if missing:
+            return missing
+        
+        charges_df = self._load(charges_file)
+        
+        # Analyze charge type distribution if available
+        charge_type_analysis = {}
+        if 'charge_type' in charges_df.columns:
+            charge_types = charges_df['charge_type'].value_counts()
+            charge_type_analysis = charge_types.to_dict()
+        elif 'description' in charges_df.columns:
+            # Use description as proxy for charge type
+            descriptions = charges_df['description'].value_counts()
+            charge_type_analysis = descriptions.head(10).to_dict()
+        
+        # Basic distribution health check
+        total_charges = len(charges_df)
+        unique_types = len(charge_type_analysis)
+        
+        # Health score based on diversity (expect rent, CAM, insurance, etc.)
+        expected_min_types = 3  # At least rent, CAM, other
+        distribution_health = min(100, (unique_types / expected_min_types) * 100)
+        
+        status = "PASS" if distribution_health >= 80 else "WARNING" if distribution_health >= 60 else "FAIL"
+        
+        critical_issues = []
+        if unique_types < expected_min_types:
+            critical_issues.append(f"Only {unique_types} charge types found, expected at least {expected_min_types}")
+        
+        return AccuracyTestResult(
+            test_id="CHG_TYP_001",
+            test_name="Charge Type Distribution",
+            category="Charge Integration",
+            target_accuracy=80.0,
+            actual_accuracy=distribution_health,
+            variance_amount=expected_min_types - unique_types,
+            variance_pct=100 - distribution_health,
+            status=status,
+            critical_issues=critical_issues,
+            recommendations=[
+                "Review charge type classification",
+                "Ensure all charge types are captured",
+                "Validate charge type mapping from source system"
+            ] if distribution_health < 80 else ["Charge type distribution appears healthy"],
+            detailed_metrics={
+                'total_charges': total_charges,
+                'unique_types': unique_types,
+                'distribution_health': distribution_health,
+                'charge_type_breakdown': charge_type_analysis
+            },
+            execution_time=0.0,
+            timestamp=None
+        )
     
     def _validate_business_rule_compliance(self) -> List[AccuracyTestResult]:
         """Validate compliance with Fund 2 business rules"""
         results = []
         
+        # Parse the amendments and tally their statuses once for all three tests;
+        # if that fails, each test loads the file itself and reports the problem
+        amendments_file = self._paths['amendments']
+        amendments_df = status_counts = None
+        try:
+            if self._file_exists(amendments_file):
+                amendments_df = self._load(amendments_file)
+                status_counts = amendments_df['amendment status'].astype('category').value_counts()
+        except Exception:
+            amendments_df = status_counts = None
+        
         # Test 1: Proposal in DM Exclusion
-        result = self._test_proposal_exclusion()
+        result = self._test_proposal_exclusion(amendments_df, status_counts)
         results.append(result)
         
         # Test 2: Status Filter Compliance
-        result = self._test_status_filter_compliance()
+        result = self._test_status_filter_compliance(amendments_df, status_counts)
         results.append(result)
         
         # Test 3: Date Filter Compliance
-        result = self._test_date_filter_compliance()
+        result = self._test_date_filter_compliance(amendments_df)
         results.append(result)
         
         return results
     
-    def _test_proposal_exclusion(self) -> AccuracyTestResult:
+    @_accuracy_test("Proposal Exclusion")
+    def _test_proposal_exclusion(self, amendments_df: Optional[pd.DataFrame] = None,
+                                 status_counts: Optional[pd.Series] = None) -> AccuracyTestResult:
         """Test exclusion of 'Proposal in DM' amendment types"""
-        start_time = datetime.now()
+        amendments_file = self._paths['amendments']
         
-        try:
-            amendments_file = f"{self.data_path}/Fund2_Filtered/dim_fp_amendmentsunitspropertytenant_fund2.csv"
-            
-            if not os.path.exists(amendments_file):
-                return self._create_file_missing_result("Proposal Exclusion", [amendments_file])
-            
-            amendments_df = pd.read_csv(amendments_file)
-            
-            # Count proposal amendments
-            proposal_amendments = amendments_df[
-                amendments_df['amendment status'] == 'Proposal in DM'
-            ]
-            
-            total_amendments = len(amendments_df)
-            proposal_count = len(proposal_amendments)
-            
-            # Active amendments that should be used (excluding proposals)
-            active_statuses = ['Activated', 'Superseded']
-            active_amendments = amendments_df[
-                amendments_df['amendment status'].isin(active_statuses)
-            ]
-            active_count = len(active_amendments)
-            
-            # Calculate exclusion compliance
-            if proposal_count > 0:
-                exclusion_rate = (proposal_count / (proposal_count + active_count) * 100)
-                compliance_score = 100 - exclusion_rate  # Want to exclude proposals
-            else:
-                compliance_score = 100  # Perfect if no proposals to exclude
-            
-            status = "PASS" if compliance_score >= 95 or proposal_count == 0 else "WARNING" if compliance_score >= 90 else "FAIL"
-            
-            critical_issues = []
-            if proposal_count > (total_amendments * 0.1):  # >10% proposals
-                critical_issues.append(f"High proposal rate: {proposal_count:,} of {total_amendments:,} ({proposal_count/total_amendments*100:.1f}%)")
-            
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            return AccuracyTestResult(
-                test_id="BUS_PRO_001",
-                test_name="Proposal in DM Exclusion",
-                category="Business Rules",
-                target_accuracy=100.0,
-                actual_accuracy=compliance_score,
-                variance_amount=proposal_count,
-                variance_pct=proposal_count / total_amendments * 100 if total_amendments > 0 else 0,
-                status=status,
-                critical_issues=critical_issues,
-                recommendations=[
-                    "Exclude 'Proposal in DM' amendments from rent calculations",
-                    "Review amendment workflow to reduce proposal volume",
-                    "Focus calculations on 'Activated' and 'Superseded' only"
-                ] if proposal_count > 0 else ["No proposal amendments found - good business rule compliance"],
-                detailed_metrics={
-                    'total_amendments': total_amendments,
-                    'proposal_count': proposal_count,
-                    'active_count': active_count,
-                    'proposal_rate': proposal_count / total_amendments * 100 if total_amendments > 0 else 0,
-                    'compliance_score': compliance_score
-                },
-                execution_time=execution_time,
-                timestamp=start_time
-            )
-            
-        except Exception as e:
-            return self._create_error_result("Proposal Exclusion", str(e))
+        missing = self._require("Proposal Exclusion", [amendments_file])
+        if missing:
+            return missing
+        
+        if amendments_df is None:
+            amendments_df = self._load(amendments_file)
+        
+        # One status tally serves both counts
+        if status_counts is None:
+            status_counts = amendments_df['amendment status'].astype('category').value_counts()
+        total_amendments = len(amendments_df)
+        
+        # Count proposal amendments
+        proposal_count = int(status_counts.get('Proposal in DM', 0))
+        
+        # Active amendments that should be used (excluding proposals)
+        active_statuses = ['Activated', 'Superseded']
+        active_count = int(status_counts.reindex(active_statuses, fill_value=0).sum())
+        
+        # Calculate exclusion compliance
+        if proposal_count > 0:
+            exclusion_rate = (proposal_count / (proposal_count + active_count) * 100)
+            compliance_score = 100 - exclusion_rate  # Want to exclude proposals
+        else:
+            compliance_score = 100  # Perfect if no proposals to exclude
+        
+        status = "PASS" if compliance_score >= 95 or proposal_count == 0 else "WARNING" if compliance_score >= 90 else "FAIL"
+        
+        critical_issues = []
+        if proposal_count > (total_amendments * 0.1):  # >10% proposals
+            critical_issues.append(f"High proposal rate: {proposal_count:,} of {total_amendments:,} ({proposal_count/total_amendments*100:.1f}%)")
+        
+        return AccuracyTestResult(
+            test_id="BUS_PRO_001",
+            test_name="Proposal in DM Exclusion",
+            category="Business Rules",
+            target_accuracy=100.0,
+            actual_accuracy=compliance_score,
+            variance_amount=proposal_count,
+            variance_pct=proposal_count / total_amendments * 100 if total_amendments > 0 else 0,
+            status=status,
+            critical_issues=critical_issues,
+            recommendations=[
+                "Exclude 'Proposal in DM' amendments from rent calculations",
+                "Review amendment workflow to reduce proposal volume",
+                "Focus calculations on 'Activated' and 'Superseded' only"
+            ] if proposal_count > 0 else ["No proposal amendments found - good business rule compliance"],
+            detailed_metrics={
+                'total_amendments': total_amendments,
+                'proposal_count': proposal_count,
+                'active_count': active_count,
+                'proposal_rate': proposal_count / total_amendments * 100 if total_amendments > 0 else 0,
+                'compliance_score': compliance_score
+            },
+            execution_time=0.0,
+            timestamp=None
+        )
     
-    def _test_status_filter_compliance(self) -> AccuracyTestResult:
+    @_accuracy_test("Status Filter Compliance")
+    def _test_status_filter_compliance(self, amendments_df: Optional[pd.DataFrame] = None,
+                                       status_counts: Optional[pd.Series] = None) -> AccuracyTestResult:
         """Test compliance with status filtering rules"""
-        start_time = datetime.now()
+        amendments_file = self._paths['amendments']
         
-        try:
-            amendments_file = f"{self.data_path}/Fund2_Filtered/dim_fp_amendmentsunitspropertytenant_fund2.csv"
-            
-            if not os.path.exists(amendments_file):
-                return self._create_file_missing_result("Status Filter Compliance", [amendments_file])
-            
-            amendments_df = pd.read_csv(amendments_file)
-            
-            # Analyze status distribution
-            status_counts = amendments_df['amendment status'].value_counts()
-            total_amendments = len(amendments_df)
-            
-            # Target statuses for rent calculations
-            target_statuses = ['Activated', 'Superseded']
-            target_amendments = amendments_df[
-                amendments_df['amendment status'].isin(target_statuses)
-            ]
-            target_count = len(target_amendments)
-            
-            # Statuses that should be excluded
-            exclude_statuses = ['Proposal in DM', 'Terminated', 'Expired', 'Draft']
-            excluded_amendments = amendments_df[
-                amendments_df['amendment status'].isin(exclude_statuses)
-            ]
-            excluded_count = len(excluded_amendments)
-            
-            # Calculate compliance score
-            compliance_rate = (target_count / total_amendments * 100) if total_amendments > 0 else 0
-            
-            status = "PASS" if compliance_rate >= 80 else "WARNING" if compliance_rate >= 60 else "FAIL"
-            
-            critical_issues = []
-            if compliance_rate < 80:
-                critical_issues.append(f"Low target status rate: {compliance_rate:.1f}% (need 80%+)")
-            
-            if excluded_count > (total_amendments * 0.2):  # >20% excluded
-                critical_issues.append(f"High exclusion rate: {excluded_count:,} of {total_amendments:,} ({excluded_count/total_amendments*100:.1f}%)")
-            
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            return AccuracyTestResult(
-                test_id="BUS_STA_001",
-                test_name="Status Filter Compliance",
-                category="Business Rules",
-                target_accuracy=80.0,
-                actual_accuracy=compliance_rate,
-                variance_amount=total_amendments - target_count,
-                variance_pct=100 - compliance_rate,
-                status=status,
-                critical_issues=critical_issues,
-                recommendations=[
-                    "Focus on 'Activated' and 'Superseded' statuses",
-                    "Exclude non-active statuses from calculations",
-                    "Review amendment status distribution patterns"
-                ] if compliance_rate < 80 else ["Status filtering compliance is adequate"],
-                detailed_metrics={
-                    'total_amendments': total_amendments,
-                    'target_count': target_count,
-                    'excluded_count': excluded_count,
-                    'compliance_rate': compliance_rate,
-                    'status_breakdown': status_counts.to_dict()
-                },
-                execution_time=execution_time,
-                timestamp=start_time
-            )
-            
-        except Exception as e:
-            return self._create_error_result("Status Filter Compliance", str(e))
+        missing = self._require("Status Filter Compliance", [amendments_file])
+        if missing:
+            return missing
+        
+        if amendments_df is None:
+            amendments_df = self._load(amendments_file)
+        
+        # Analyze status distribution
+        if status_counts is None:
+            status_counts = amendments_df['amendment status'].astype('category').value_counts()
+        total_amendments = len(amendments_df)
+        
+        # Target statuses for rent calculations
+        target_statuses = ['Activated', 'Superseded']
+        target_count = int(status_counts.reindex(target_statuses, fill_value=0).sum())
+        
+        # Statuses that should be excluded
+        exclude_statuses = ['Proposal in DM', 'Terminated', 'Expired', 'Draft']
+        excluded_count = int(status_counts.reindex(exclude_statuses, fill_value=0).sum())
+        
+        # Calculate compliance score
+        compliance_rate = (target_count / total_amendments * 100) if total_amendments > 0 else 0
+        
+        status = "PASS" if compliance_rate >= 80 else "WARNING" if compliance_rate >= 60 else "FAIL"
+        
+        critical_issues = []
+        if compliance_rate < 80:
+            critical_issues.append(f"Low target status rate: {compliance_rate:.1f}% (need 80%+)")
+        
+        if excluded_count > (total_amendments * 0.2):  # >20% excluded
+            critical_issues.append(f"High exclusion rate: {excluded_count:,} of {total_amendments:,} ({excluded_count/total_amendments*100:.1f}%)")
+        
+        return AccuracyTestResult(
+            test_id="BUS_STA_001",
+            test_name="Status Filter Compliance",
+            category="Business Rules",
+            target_accuracy=80.0,
+            actual_accuracy=compliance_rate,
+            variance_amount=total_amendments - target_count,
+            variance_pct=100 - compliance_rate,
+            status=status,
+            critical_issues=critical_issues,
+            recommendations=[
+                "Focus on 'Activated' and 'Superseded' statuses",
+                "Exclude non-active statuses from calculations",
+                "Review amendment status distribution patterns"
+            ] if compliance_rate < 80 else ["Status filtering compliance is adequate"],
+            detailed_metrics={
+                'total_amendments': total_amendments,
+                'target_count': target_count,
+                'excluded_count': excluded_count,
+                'compliance_rate': compliance_rate,
+                'status_breakdown': status_counts.to_dict()
+            },
+            execution_time=0.0,
+            timestamp=None
+        )
     
-    def _test_date_filter_compliance(self) -> AccuracyTestResult:
+    @_accuracy_test("Date Filter Compliance")
+    def _test_date_filter_compliance(self, amendments_df: Optional[pd.DataFrame] = None) -> AccuracyTestResult:
         """Test date filtering compliance for month-to-month leases"""
-        start_time = datetime.now()
+        amendments_file = self._paths['amendments']
         
-        try:
-            amendments_file = f"{self.data_path}/Fund2_Filtered/dim_fp_amendmentsunitspropertytenant_fund2.csv"
-            
-            if not os.path.exists(amendments_file):
-                return self._create_file_missing_result("Date Filter Compliance", [amendments_file])
-            
-            amendments_df = pd.read_csv(amendments_file)
-            
-            # Convert date columns
-            date_columns = ['amendment start date', 'amendment end date']
-            for col in date_columns:
-                if col in amendments_df.columns:
-                    amendments_df[col] = pd.to_datetime(amendments_df[col], errors='coerce')
-            
-            total_amendments = len(amendments_df)
-            
-            # Analyze date patterns
-            null_end_dates = amendments_df['amendment end date'].isnull().sum()
-            future_start_dates = 0
-            expired_leases = 0
-            current_date = datetime.now()
-            
-            if 'amendment start date' in amendments_df.columns:
-                future_start_dates = (amendments_df['amendment start date'] > current_date).sum()
-            
-            if 'amendment end date' in amendments_df.columns:
-                valid_end_dates = amendments_df['amendment end date'].notna()
-                expired_leases = (amendments_df.loc[valid_end_dates, 'amendment end date'] < current_date).sum()
-            
-            # Calculate compliance metrics
-            month_to_month_rate = (null_end_dates / total_amendments * 100) if total_amendments > 0 else 0
-            future_starts_rate = (future_start_dates / total_amendments * 100) if total_amendments > 0 else 0
-            expired_rate = (expired_leases / total_amendments * 100) if total_amendments > 0 else 0
-            
-            # Overall date compliance (good if month-to-month handled, future/expired filtered)
-            compliance_score = 100 - future_starts_rate - expired_rate
-            
-            status = "PASS" if compliance_score >= 95 else "WARNING" if compliance_score >= 90 else "FAIL"
-            
-            critical_issues = []
-            if future_starts_rate > 5:
-                critical_issues.append(f"High future start date rate: {future_starts_rate:.1f}%")
-            if expired_rate > 10:
-                critical_issues.append(f"High expired lease rate: {expired_rate:.1f}%")
-            
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            return AccuracyTestResult(
-                test_id="BUS_DAT_001",
-                test_name="Date Filter Compliance",
-                category="Business Rules",
-                target_accuracy=95.0,
-                actual_accuracy=compliance_score,
-                variance_amount=future_start_dates + expired_leases,
-                variance_pct=100 - compliance_score,
-                status=status,
-                critical_issues=critical_issues,
-                recommendations=[
-                    "Handle null end dates as month-to-month leases",
-                    "Exclude future start dates from current rent roll",
-                    "Exclude expired leases from current calculations",
-                    "Implement proper date filtering in DAX measures"
-                ] if compliance_score < 95 else ["Date filtering compliance is good"],
-                detailed_metrics={
-                    'total_amendments': total_amendments,
-                    'null_end_dates': null_end_dates,
-                    'month_to_month_rate': month_to_month_rate,
-                    'future_start_dates': future_start_dates,
-                    'future_starts_rate': future_starts_rate,
-                    'expired_leases': expired_leases,
-                    'expired_rate': expired_rate,
-                    'compliance_score': compliance_score
-                },
-                execution_time=execution_time,
-                timestamp=start_time
-            )
-            
-        except Exception as e:
-            return self._create_error_result("Date Filter Compliance", str(e))
+        missing = self._require("Date Filter Compliance", [amendments_file])
+        if missing:
+            return missing
+        
+        if amendments_df is None:
+            amendments_df = self._load(amendments_file)
+        
+        # Convert any date columns not already parsed at load, on a new frame
+        # since the loaded one is shared with other tests
+        unparsed = [
+            col for col in self._DATE_COLS
+            if col in amendments_df.columns and not pd.api.types.is_datetime64_any_dtype(amendments_df[col])
+        ]
+        if unparsed:
+            amendments_df = amendments_df.assign(**{
+                col: self._parse_dates(amendments_df[col]) for col in unparsed
+            })
+        
+        total_amendments = len(amendments_df)
+        
+        # Analyze date patterns in one pass over both date columns
+        dates = amendments_df[['amendment start date', 'amendment end date']].to_numpy(dtype='datetime64[ns]')
+        start, end = dates[:, 0], dates[:, 1]
+        now = np.datetime64(self._current_date or datetime.now(), 'ns')
+        null_end = np.isnat(end)
+        
+        null_end_dates = int(null_end.sum())
+        future_start_dates = int(((start > now) & ~np.isnat(start)).sum())
+        expired_leases = int(((end < now) & ~null_end).sum())
+        
+        # Calculate compliance metrics
+        month_to_month_rate = (null_end_dates / total_amendments * 100) if total_amendments > 0 else 0
+        future_starts_rate = (future_start_dates / total_amendments * 100) if total_amendments > 0 else 0
+        expired_rate = (expired_leases / total_amendments * 100) if total_amendments > 0 else 0
+        
+        # Overall date compliance (good if month-to-month handled, future/expired filtered)
+        compliance_score = 100 - future_starts_rate - expired_rate
+        
+        status = "PASS" if compliance_score >= 95 else "WARNING" if compliance_score >= 90 else "FAIL"
+        
+        critical_issues = []
+        if future_starts_rate > 5:
+            critical_issues.append(f"High future start date rate: {future_starts_rate:.1f}%")
+        if expired_rate > 10:
+            critical_issues.append(f"High expired lease rate: {expired_rate:.1f}%")
+        
+        return AccuracyTestResult(
+            test_id="BUS_DAT_001",
+            test_name="Date Filter Compliance",
+            category="Business Rules",
+            target_accuracy=95.0,
+            actual_accuracy=compliance_score,
+            variance_amount=future_start_dates + expired_leases,
+            variance_pct=100 - compliance_score,
+            status=status,
+            critical_issues=critical_issues,
+            recommendations=[
+                "Handle null end dates as month-to-month leases",
+                "Exclude future start dates from current rent roll",
+                "Exclude expired leases from current calculations",
+                "Implement proper date filtering in DAX measures"
+            ] if compliance_score < 95 else ["Date filtering compliance is good"],
+            detailed_metrics={
+                'total_amendments': total_amendments,
+                'null_end_dates': null_end_dates,
+                'month_to_month_rate': month_to_month_rate,
+                'future_start_dates': future_start_dates,
+                'future_starts_rate': future_starts_rate,
+                'expired_leases': expired_leases,
+                'expired_rate': expired_rate,
+                'compliance_score': compliance_score
+            },
+            execution_time=0.0,
+            timestamp=None
+        )
     
     def _validate_rent_roll_accuracy(self) -> List[AccuracyTestResult]:
         """Validate rent roll accuracy against Yardi exports"""
@@ -909,104 +1154,100 @@ class EnhancedAccuracyValidator:
         
         return results
     
+    @_accuracy_test("Rent Roll vs Yardi")
     def _test_rent_roll_vs_yardi(self) -> AccuracyTestResult:
         """Test rent roll accuracy vs Yardi using enhanced logic"""
-        start_time = datetime.now()
+        # Test with latest available data
+        generated_file = self._paths['generated_rent_roll']
+        yardi_file = self._paths['yardi_mar31']
         
-        try:
-            # Test with latest available data
-            generated_file = f"{self.results_path}/fund2_rent_roll_generated_mar31_2025.csv"
-            yardi_file = f"{self.yardi_path}/03.31.25.xlsx"
-            
-            if not os.path.exists(generated_file) or not os.path.exists(yardi_file):
-                return self._create_file_missing_result("Rent Roll vs Yardi", [generated_file, yardi_file])
-            
-            # Load data
-            generated_df = pd.read_csv(generated_file)
-            
-            # Load and clean Yardi export
-            if yardi_file.endswith('.xlsx'):
-                yardi_df = pd.read_excel(yardi_file, sheet_name=0)
-            else:
-                yardi_df = pd.read_csv(yardi_file)
-            
-            # Filter to Fund 2 properties
-            property_cols = [col for col in yardi_df.columns if 'prop' in col.lower() and 'code' in col.lower()]
-            if property_cols:
-                yardi_df = yardi_df[yardi_df[property_cols[0]].astype(str).str.upper().str.startswith('X')].copy()
-            
-            # Calculate key metrics
-            generated_metrics = self._calculate_comprehensive_metrics(generated_df, "Generated")
-            yardi_metrics = self._calculate_comprehensive_metrics(yardi_df, "Yardi")
-            
-            # Calculate accuracy across key metrics
-            key_metrics = ['total_monthly_rent', 'total_leased_sf', 'property_count', 'tenant_count']
-            accuracy_scores = []
-            metric_comparisons = {}
-            
-            for metric in key_metrics:
-                gen_val = generated_metrics.get(metric, 0)
-                yardi_val = yardi_metrics.get(metric, 0)
-                
-                if yardi_val > 0:
-                    accuracy = max(0, min(100, (1 - abs(gen_val - yardi_val) / yardi_val) * 100))
-                else:
-                    accuracy = 100 if gen_val == 0 else 0
-                
-                accuracy_scores.append(accuracy)
-                metric_comparisons[metric] = {
-                    'generated': gen_val,
-                    'yardi': yardi_val,
-                    'accuracy': accuracy,
-                    'variance_amount': gen_val - yardi_val,
-                    'variance_pct': ((gen_val - yardi_val) / yardi_val * 100) if yardi_val != 0 else 0
-                }
-            
-            overall_accuracy = sum(accuracy_scores) / len(accuracy_scores) if accuracy_scores else 0
-            
-            # Enhanced status determination for Fund 2
-            if overall_accuracy >= 95.0:
-                status = "PASS"
-            elif overall_accuracy >= 90.0:
-                status = "WARNING"
+        missing = self._require("Rent Roll vs Yardi", [generated_file, yardi_file])
+        if missing:
+            return missing
+        
+        # Load data
+        generated_df = self._load(generated_file)
+        
+        # Load and clean Yardi export
+        yardi_df = self._read_yardi_export(yardi_file)
+        
+        # Filter to Fund 2 properties
+        property_cols = [col for col in yardi_df.columns if 'prop' in col.lower() and 'code' in col.lower()]
+        if property_cols:
+            codes = yardi_df[property_cols[0]]
+            try:
+                is_fund2 = codes.astype('string[pyarrow]').str.startswith(('X', 'x'), na=False)
+            except ImportError:
+                is_fund2 = codes.astype(str).str.upper().str.startswith('X')
+            yardi_df = yardi_df[is_fund2]
+        
+        # Calculate key metrics
+        generated_metrics = self._calculate_comprehensive_metrics(generated_df, "Generated")
+        yardi_metrics = self._calculate_comprehensive_metrics(yardi_df, "Yardi")
+        
+        # Calculate accuracy across key metrics
+        key_metrics = ['total_monthly_rent', 'total_leased_sf', 'property_count', 'tenant_count']
+        accuracy_scores = []
+        metric_comparisons = {}
+        
+        for metric in key_metrics:
+            gen_val = generated_metrics.get(metric, 0)
+            yardi_val = yardi_metrics.get(metric, 0)
+            
+            if yardi_val > 0:
+                accuracy = max(0, min(100, (1 - abs(gen_val - yardi_val) / yardi_val) * 100))
             else:
-                status = "FAIL"
-            
-            # Critical issues for Fund 2
-            critical_issues = []
-            if overall_accuracy < 95.0:
-                critical_issues.append(f"Overall accuracy {overall_accuracy:.1f}% below Fund 2 target of 95%+")
-            
-            # Check for the $232K gap issue
-            rent_variance = metric_comparisons.get('total_monthly_rent', {}).get('variance_amount', 0)
-            if abs(rent_variance) > 200000:  # >$200K variance
-                critical_issues.append(f"Large monthly rent variance: ${rent_variance:,.0f} (Fund 2 critical issue)")
-            
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            return AccuracyTestResult(
-                test_id="RNT_YAR_001",
-                test_name="Rent Roll vs Yardi Accuracy (Fund 2)",
-                category="Rent Roll Accuracy",
-                target_accuracy=95.0,
-                actual_accuracy=overall_accuracy,
-                variance_amount=abs(rent_variance) if rent_variance else 0,
-                variance_pct=100 - overall_accuracy,
-                status=status,
-                critical_issues=critical_issues,
-                recommendations=self._generate_yardi_accuracy_recommendations(overall_accuracy, metric_comparisons),
-                detailed_metrics={
-                    'generated_metrics': generated_metrics,
-                    'yardi_metrics': yardi_metrics,
-                    'metric_comparisons': metric_comparisons,
-                    'overall_accuracy': overall_accuracy
-                },
-                execution_time=execution_time,
-                timestamp=start_time
-            )
-            
-        except Exception as e:
-            return self._create_error_result("Rent Roll vs Yardi", str(e))
+                accuracy = 100 if gen_val == 0 else 0
+            
+            accuracy_scores.append(accuracy)
+            metric_comparisons[metric] = {
+                'generated': gen_val,
+                'yardi': yardi_val,
+                'accuracy': accuracy,
+                'variance_amount': gen_val - yardi_val,
+                'variance_pct': ((gen_val - yardi_val) / yardi_val * 100) if yardi_val != 0 else 0
+            }
+        
+        overall_accuracy = sum(accuracy_scores) / len(accuracy_scores) if accuracy_scores else 0
+        
+        # Enhanced status determination for Fund 2
+        if overall_accuracy >= 95.0:
+            status = "PASS"
+        elif overall_accuracy >= 90.0:
+            status = "WARNING"
+        else:
+            status = "FAIL"
+        
+        # Critical issues for Fund 2
+        critical_issues = []
+        if overall_accuracy < 95.0:
+            critical_issues.append(f"Overall accuracy {overall_accuracy:.1f}% below Fund 2 target of 95%+")
+        
+        # Check for the $232K gap issue
+        rent_variance = metric_comparisons.get('total_monthly_rent', {}).get('variance_amount', 0)
+        if abs(rent_variance) > 200000:  # >$200K variance
+            critical_issues.append(f"Large monthly rent variance: ${rent_variance:,.0f} (Fund 2 critical issue)")
+        
+        return AccuracyTestResult(
+            test_id="RNT_YAR_001",
+            test_name="Rent Roll vs Yardi Accuracy (Fund 2)",
+            category="Rent Roll Accuracy",
+            target_accuracy=95.0,
+            actual_accuracy=overall_accuracy,
+            variance_amount=abs(rent_variance) if rent_variance else 0,
+            variance_pct=100 - overall_accuracy,
+            status=status,
+            critical_issues=critical_issues,
+            recommendations=self._generate_yardi_accuracy_recommendations(overall_accuracy, metric_comparisons),
+            detailed_metrics={
+                'generated_metrics': generated_metrics,
+                'yardi_metrics': yardi_metrics,
+                'metric_comparisons': metric_comparisons,
+                'overall_accuracy': overall_accuracy
+            },
+            execution_time=0.0,
+            timestamp=None
+        )
     
     def _calculate_comprehensive_metrics(self, df: pd.DataFrame, source_label: str) -> Dict[str, float]:
         """Calculate comprehensive metrics from rent roll dataframe"""
@@ -1016,47 +1257,45 @@ class EnhancedAccuracyValidator:
             # Record count
             metrics['record_count'] = len(df)
             
-            # Total monthly rent - try multiple column patterns
-            rent_cols = []
-            for pattern in ['rent', 'month', 'amount']:
-                matching_cols = [col for col in df.columns if pattern in col.lower()]
-                rent_cols.extend(matching_cols)
-            
-            rent_cols = list(set(rent_cols))  # Remove duplicates
-            if rent_cols:
-                # Use first numeric rent column
-                for col in rent_cols:
-                    if df[col].dtype in ['float64', 'int64']:
-                        metrics['total_monthly_rent'] = df[col].sum()
-                        break
-                else:
-                    metrics['total_monthly_rent'] = 0
+            # Resolve numeric columns once; covers int32/float32 and nullable dtypes too
+            numeric_cols = set(df.select_dtypes(include=[np.number]).columns)
+            
+            # Classify columns in a single pass over the lowercased names
+            rent_cols, sf_cols, prop_cols, tenant_cols = [], [], [], []
+            for col in df.columns:
+                lower = str(col).lower()
+                if 'rent' in lower or 'month' in lower or 'amount' in lower:
+                    rent_cols.append(col)
+                if any(term in lower for term in ('sf', 'square', 'area', 'footage')):
+                    sf_cols.append(col)
+                if 'prop' in lower:
+                    prop_cols.append(col)
+                if 'tenant' in lower:
+                    tenant_cols.append(col)
+            
+            # Total monthly rent - use first numeric rent column
+            rent_col = next((col for col in rent_cols if col in numeric_cols), None)
+            if rent_col is not None:
+                metrics['total_monthly_rent'] = np.nansum(df[rent_col].to_numpy(dtype=np.float64, na_value=np.nan))
             else:
                 metrics['total_monthly_rent'] = 0
             
             # Total leased SF
-            sf_cols = [col for col in df.columns if any(term in col.lower() for term in ['sf', 'square', 'area', 'footage'])]
-            if sf_cols:
-                for col in sf_cols:
-                    if df[col].dtype in ['float64', 'int64']:
-                        metrics['total_leased_sf'] = df[col].sum()
-                        break
-                else:
-                    metrics['total_leased_sf'] = 0
+            sf_col = next((col for col in sf_cols if col in numeric_cols), None)
+            if sf_col is not None:
+                metrics['total_leased_sf'] = np.nansum(df[sf_col].to_numpy(dtype=np.float64, na_value=np.nan))
             else:
                 metrics['total_leased_sf'] = 0
             
             # Property count
-            prop_cols = [col for col in df.columns if 'prop' in col.lower()]
             if prop_cols:
-                metrics['property_count'] = df[prop_cols[0]].nunique()
+                metrics['property_count'] = self._count_distinct(df[prop_cols[0]])
             else:
                 metrics['property_count'] = 0
             
             # Tenant count
-            tenant_cols = [col for col in df.columns if 'tenant' in col.lower()]
             if tenant_cols:
-                metrics['tenant_count'] = df[tenant_cols[0]].nunique()
+                metrics['tenant_count'] = self._count_distinct(df[tenant_cols[0]])
             else:
                 metrics['tenant_count'] = 0
             
@@ -1080,69 +1319,61 @@ class EnhancedAccuracyValidator:
         
         return results
     
+    @_accuracy_test("Variance Breakdown")
     def _test_variance_breakdown(self) -> AccuracyTestResult:
         """Test variance breakdown to identify Fund 2 gap sources"""
-        start_time = datetime.now()
+        # Simulate variance analysis - in production this would analyze actual variance sources
+        variance_analysis = {
+            'missing_charges': 232000,  # The $232K gap from Fund 2 analysis
+            'duplicate_amendments': 25000,  # Estimated impact of duplicates
+            'proposal_inclusions': 15000,  # Impact of including proposals
+            'date_filter_issues': 8000,  # Impact of date filtering problems
+            'status_filter_issues': 5000   # Impact of status filtering
+        }
         
-        try:
-            # Simulate variance analysis - in production this would analyze actual variance sources
-            variance_analysis = {
-                'missing_charges': 232000,  # The $232K gap from Fund 2 analysis
-                'duplicate_amendments': 25000,  # Estimated impact of duplicates
-                'proposal_inclusions': 15000,  # Impact of including proposals
-                'date_filter_issues': 8000,  # Impact of date filtering problems
-                'status_filter_issues': 5000   # Impact of status filtering
-            }
-            
-            total_variance = sum(variance_analysis.values())
-            target_variance = 25000  # Target: <$25K variance acceptable
-            
-            variance_accuracy = max(0, (1 - (total_variance - target_variance) / target_variance) * 100) if target_variance > 0 else 0
-            
-            status = "PASS" if total_variance <= target_variance else "FAIL"
-            
-            critical_issues = []
-            if total_variance > target_variance:
-                critical_issues.append(f"Total variance ${total_variance:,.0f} exceeds target ${target_variance:,.0f}")
-            
-            # Identify top variance contributors
-            sorted_variances = sorted(variance_analysis.items(), key=lambda x: x[1], reverse=True)
-            top_contributor = sorted_variances[0] if sorted_variances else None
-            
-            if top_contributor and top_contributor[1] > 100000:
-                critical_issues.append(f"Major variance source: {top_contributor[0]} = ${top_contributor[1]:,.0f}")
-            
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            return AccuracyTestResult(
-                test_id="VAR_BRK_001",
-                test_name="Variance Breakdown Analysis",
-                category="Variance Analysis",
-                target_accuracy=90.0,
-                actual_accuracy=variance_accuracy,
-                variance_amount=total_variance,
-                variance_pct=(total_variance / target_variance * 100 - 100) if target_variance > 0 else 100,
-                status=status,
-                critical_issues=critical_issues,
-                recommendations=[
-                    "Address missing charges issue (largest variance contributor)",
-                    "Implement latest amendment WITH charges logic",
-                    "Remove duplicate active amendments",
-                    "Exclude proposal amendments from calculations"
-                ] if total_variance > target_variance else ["Variance within acceptable range"],
-                detailed_metrics={
-                    'variance_breakdown': variance_analysis,
-                    'total_variance': total_variance,
-                    'target_variance': target_variance,
-                    'top_contributor': top_contributor,
-                    'variance_accuracy': variance_accuracy
-                },
-                execution_time=execution_time,
-                timestamp=start_time
-            )
-            
-        except Exception as e:
-            return self._create_error_result("Variance Breakdown", str(e))
+        total_variance = sum(variance_analysis.values())
+        target_variance = 25000  # Target: <$25K variance acceptable
+        
+        variance_accuracy = max(0, (1 - (total_variance - target_variance) / target_variance) * 100) if target_variance > 0 else 0
+        
+        status = "PASS" if total_variance <= target_variance else "FAIL"
+        
+        critical_issues = []
+        if total_variance > target_variance:
+            critical_issues.append(f"Total variance ${total_variance:,.0f} exceeds target ${target_variance:,.0f}")
+        
+        # Identify top variance contributors
+        top_contributor = max(variance_analysis.items(), key=operator.itemgetter(1), default=None)
+        
+        if top_contributor and top_contributor[1] > 100000:
+            critical_issues.append(f"Major variance source: {top_contributor[0]} = ${top_contributor[1]:,.0f}")
+        
+        return AccuracyTestResult(
+            test_id="VAR_BRK_001",
+            test_name="Variance Breakdown Analysis",
+            category="Variance Analysis",
+            target_accuracy=90.0,
+            actual_accuracy=variance_accuracy,
+            variance_amount=total_variance,
+            variance_pct=(total_variance / target_variance * 100 - 100) if target_variance > 0 else 100,
+            status=status,
+            critical_issues=critical_issues,
+            recommendations=[
+                "Address missing charges issue (largest variance contributor)",
+                "Implement latest amendment WITH charges logic",
+                "Remove duplicate active amendments",
+                "Exclude proposal amendments from calculations"
+            ] if total_variance > target_variance else ["Variance within acceptable range"],
+            detailed_metrics={
+                'variance_breakdown': variance_analysis,
+                'total_variance': total_variance,
+                'target_variance': target_variance,
+                'top_contributor': top_contributor,
+                'variance_accuracy': variance_accuracy
+            },
+            execution_time=0.0,
+            timestamp=None
+        )
     
     def _validate_data_completeness(self) -> List[AccuracyTestResult]:
         """Validate data completeness for Fund 2 critical fields"""
@@ -1153,86 +1384,76 @@ class EnhancedAccuracyValidator:
         
         return results
     
+    @_accuracy_test("Data Completeness")
     def _test_data_completeness(self) -> AccuracyTestResult:
         """Test data completeness for critical fields"""
-        start_time = datetime.now()
+        amendments_file = self._paths['amendments']
+        
+        missing = self._require("Data Completeness", [amendments_file])
+        if missing:
+            return missing
+        
+        amendments_df = self._load(amendments_file)
+        
+        # Critical fields for Fund 2 accuracy
+        critical_fields = [
+            'amendment hmy',
+            'property hmy', 
+            'tenant hmy',
+            'amendment sequence',
+            'amendment status',
+            'amendment start date'
+        ]
         
-        try:
-            amendments_file = f"{self.data_path}/Fund2_Filtered/dim_fp_amendmentsunitspropertytenant_fund2.csv"
-            
-            if not os.path.exists(amendments_file):
-                return self._create_file_missing_result("Data Completeness", [amendments_file])
-            
-            amendments_df = pd.read_csv(amendments_file)
-            
-            # Critical fields for Fund 2 accuracy
-            critical_fields = [
-                'amendment hmy',
-                'property hmy', 
-                'tenant hmy',
-                'amendment sequence',
-                'amendment status',
-                'amendment start date'
-            ]
-            
-            completeness_analysis = {}
-            total_records = len(amendments_df)
-            
-            for field in critical_fields:
-                if field in amendments_df.columns:
-                    non_null_count = amendments_df[field].notna().sum()
-                    completeness_pct = (non_null_count / total_records * 100) if total_records > 0 else 0
-                    completeness_analysis[field] = {
-                        'non_null_count': non_null_count,
-                        'null_count': total_records - non_null_count,
-                        'completeness_pct': completeness_pct
-                    }
-                else:
-                    completeness_analysis[field] = {
-                        'non_null_count': 0,
-                        'null_count': total_records,
-                        'completeness_pct': 0.0
-                    }
-            
-            # Calculate overall completeness score
-            completeness_scores = [analysis['completeness_pct'] for analysis in completeness_analysis.values()]
-            overall_completeness = sum(completeness_scores) / len(completeness_scores) if completeness_scores else 0
-            
-            status = "PASS" if overall_completeness >= 95.0 else "WARNING" if overall_completeness >= 90.0 else "FAIL"
-            
-            critical_issues = []
-            for field, analysis in completeness_analysis.items():
-                if analysis['completeness_pct'] < 95.0:
-                    critical_issues.append(f"{field}: {analysis['completeness_pct']:.1f}% complete ({analysis['null_count']:,} nulls)")
-            
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            return AccuracyTestResult(
-                test_id="DAT_CMP_001",
-                test_name="Data Completeness Analysis",
-                category="Data Completeness",
-                target_accuracy=95.0,
-                actual_accuracy=overall_completeness,
-                variance_amount=len(critical_issues),
-                variance_pct=100 - overall_completeness,
-                status=status,
-                critical_issues=critical_issues,
-                recommendations=[
-                    "Address null values in critical fields",
-                    "Implement data quality validation",
-                    "Review data extraction completeness"
-                ] if overall_completeness < 95.0 else ["Data completeness meets target"],
-                detailed_metrics={
-                    'total_records': total_records,
-                    'completeness_analysis': completeness_analysis,
-                    'overall_completeness': overall_completeness
-                },
-                execution_time=execution_time,
-                timestamp=start_time
-            )
-            
-        except Exception as e:
-            return self._create_error_result("Data Completeness", str(e))
+        completeness_analysis = {}
+        total_records = len(amendments_df)
+        
+        # Count non-nulls for every present field in one reduction; absent fields count 0
+        present_fields = [field for field in critical_fields if field in amendments_df.columns]
+        non_null_counts = amendments_df[present_fields].notna().sum().reindex(critical_fields, fill_value=0)
+        
+        for field, non_null_count in non_null_counts.items():
+            completeness_pct = (non_null_count / total_records * 100) if total_records > 0 else 0
+            completeness_analysis[field] = {
+                'non_null_count': non_null_count,
+                'null_count': total_records - non_null_count,
+                'completeness_pct': completeness_pct
+            }
+        
+        # Calculate overall completeness score
+        completeness_scores = [analysis['completeness_pct'] for analysis in completeness_analysis.values()]
+        overall_completeness = sum(completeness_scores) / len(completeness_scores) if completeness_scores else 0
+        
+        status = "PASS" if overall_completeness >= 95.0 else "WARNING" if overall_completeness >= 90.0 else "FAIL"
+        
+        critical_issues = []
+        for field, analysis in completeness_analysis.items():
+            if analysis['completeness_pct'] < 95.0:
+                critical_issues.append(f"{field}: {analysis['completeness_pct']:.1f}% complete ({analysis['null_count']:,} nulls)")
+        
+        return AccuracyTestResult(
+            test_id="DAT_CMP_001",
+            test_name="Data Completeness Analysis",
+            category="Data Completeness",
+            target_accuracy=95.0,
+            actual_accuracy=overall_completeness,
+            variance_amount=len(critical_issues),
+            variance_pct=100 - overall_completeness,
+            status=status,
+            critical_issues=critical_issues,
+            recommendations=[
+                "Address null values in critical fields",
+                "Implement data quality validation",
+                "Review data extraction completeness"
+            ] if overall_completeness < 95.0 else ["Data completeness meets target"],
+            detailed_metrics={
+                'total_records': total_records,
+                'completeness_analysis': completeness_analysis,
+                'overall_completeness': overall_completeness
+            },
+            execution_time=0.0,
+            timestamp=None
+        )
     
     def _validate_duplicate_amendments(self) -> List[AccuracyTestResult]:
         """Validate duplicate amendment detection and handling"""
@@ -1243,83 +1464,97 @@ class EnhancedAccuracyValidator:
         
         return results
     
+    @_accuracy_test("Duplicate Amendment Detection")
     def _test_duplicate_amendment_detection(self) -> AccuracyTestResult:
         """Test detection of duplicate active amendments"""
-        start_time = datetime.now()
+        amendments_file = self._paths['amendments']
+        
+        missing = self._require("Duplicate Amendment Detection", [amendments_file])
+        if missing:
+            return missing
+        
+        amendments_df = self._load(amendments_file)
+        
+        # Filter to active statuses
+        active_statuses = ['Activated', 'Superseded']
+        active_amendments = amendments_df[self._status_mask(amendments_df['amendment status'], active_statuses)]
+        
+        # Detect duplicates by property/tenant combination, grouping on one packed
+        # int64 key when the ids allow it instead of factorizing two columns
+        pair_key = self._pair_key(active_amendments)
+        group_keys = pair_key if pair_key is not None else ['property hmy', 'tenant hmy']
+        duplicate_analysis = active_amendments.groupby(group_keys, sort=False, observed=True).agg(
+            amendment_count=('amendment hmy', 'size'),
+            min_sequence=('amendment sequence', 'min'),
+            max_sequence=('amendment sequence', 'max')
+        )
+        if pair_key is not None:
+            packed = duplicate_analysis.index.to_numpy()
+            duplicate_analysis.index = pd.MultiIndex.from_arrays([packed >> 32, packed & 0xFFFFFFFF])
+        duplicate_analysis = duplicate_analysis.rename_axis(['property_hmy', 'tenant_hmy']).reset_index()
+        
+        # Identify actual duplicates (more than 1 active amendment per property/tenant)
+        is_duplicate = duplicate_analysis['amendment_count'] > 1
+        duplicate_count = int(is_duplicate.sum())
+        
+        # The groupby skips sorting all pairs; select the first 10 duplicates by property/tenant
+        # with a partial selection on the key columns (no full sort or frame copy), so the sample
+        # is deterministic and matches earlier reports
+        sample_keys = duplicate_analysis.loc[is_duplicate, ['property_hmy', 'tenant_hmy']].nsmallest(
+            10, ['property_hmy', 'tenant_hmy']
+        )
+        sample = duplicate_analysis.loc[sample_keys.index]
         
-        try:
-            amendments_file = f"{self.data_path}/Fund2_Filtered/dim_fp_amendmentsunitspropertytenant_fund2.csv"
-            
-            if not os.path.exists(amendments_file):
-                return self._create_file_missing_result("Duplicate Amendment Detection", [amendments_file])
-            
-            amendments_df = pd.read_csv(amendments_file)
-            
-            # Filter to active statuses
-            active_statuses = ['Activated', 'Superseded']
-            active_amendments = amendments_df[
-                amendments_df['amendment status'].isin(active_statuses)
-            ].copy()
-            
-            # Detect duplicates by property/tenant combination
-            duplicate_analysis = active_amendments.groupby(['property hmy', 'tenant hmy']).agg({
-                'amendment hmy': 'count',
-                'amendment sequence': ['min', 'max', 'nunique']
-            }).reset_index()
-            
-            # Flatten column names
-            duplicate_analysis.columns = ['property_hmy', 'tenant_hmy', 'amendment_count', 'min_sequence', 'max_sequence', 'unique_sequences']
-            
-            # Identify actual duplicates (more than 1 active amendment per property/tenant)
-            duplicates = duplicate_analysis[duplicate_analysis['amendment_count'] > 1]
-            duplicate_count = len(duplicates)
-            total_combinations = len(duplicate_analysis)
-            
-            duplicate_rate = (duplicate_count / total_combinations * 100) if total_combinations > 0 else 0
-            accuracy_score = 100 - duplicate_rate  # Perfect score = 0% duplicates
-            
-            # Fund 2 had 98 duplicate active amendments - target is 0
-            status = "PASS" if duplicate_count == 0 else "WARNING" if duplicate_count <= 5 else "FAIL"
-            
-            critical_issues = []
-            if duplicate_count > 0:
-                critical_issues.append(f"{duplicate_count:,} property/tenant combinations have multiple active amendments")
-                
-                # Check for the Fund 2 issue - 98 duplicates
-                if duplicate_count >= 90:
-                    critical_issues.append("High duplicate count similar to Fund 2 critical issue (98 duplicates)")
-            
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            return AccuracyTestResult(
-                test_id="DUP_AMN_001", 
-                test_name="Duplicate Active Amendments Detection",
-                category="Duplicate Detection",
-                target_accuracy=100.0,
-                actual_accuracy=accuracy_score,
-                variance_amount=duplicate_count,
-                variance_pct=duplicate_rate,
-                status=status,
-                critical_issues=critical_issues,
-                recommendations=[
-                    "Remove duplicate active amendments using latest sequence logic",
-                    "Implement data validation to prevent duplicate active statuses",
-                    "Use MAX(sequence) to select single amendment per property/tenant",
-                    "Review amendment status update processes"
-                ] if duplicate_count > 0 else ["No duplicate active amendments found"],
-                detailed_metrics={
-                    'total_combinations': total_combinations,
-                    'duplicate_count': duplicate_count,
-                    'duplicate_rate': duplicate_rate,
-                    'accuracy_score': accuracy_score,
-                    'sample_duplicates': duplicates.head(10).to_dict('records') if len(duplicates) > 0 else []
-                },
-                execution_time=execution_time,
-                timestamp=start_time
-            )
+        # Distinct sequences are only reported for the sample, so count them on its pairs' rows alone
+        pair_cols = ['property hmy', 'tenant hmy']
+        sample_pairs = pd.MultiIndex.from_frame(sample[['property_hmy', 'tenant_hmy']])
+        sample_rows = active_amendments[pd.MultiIndex.from_frame(active_amendments[pair_cols]).isin(sample_pairs)]
+        unique_sequences = sample_rows.groupby(pair_cols, sort=False)['amendment sequence'].nunique()
+        sample_duplicates = sample.assign(
+            unique_sequences=unique_sequences.reindex(sample_pairs).to_numpy()
+        ).to_dict('records')
+        total_combinations = len(duplicate_analysis)
+        
+        duplicate_rate = (duplicate_count / total_combinations * 100) if total_combinations > 0 else 0
+        accuracy_score = 100 - duplicate_rate  # Perfect score = 0% duplicates
+        
+        # Fund 2 had 98 duplicate active amendments - target is 0
+        status = "PASS" if duplicate_count == 0 else "WARNING" if duplicate_count <= 5 else "FAIL"
+        
+        critical_issues = []
+        if duplicate_count > 0:
+            critical_issues.append(f"{duplicate_count:,} property/tenant combinations have multiple active amendments")
             
-        except Exception as e:
-            return self._create_error_result("Duplicate Amendment Detection", str(e))
+            # Check for the Fund 2 issue - 98 duplicates
+            if duplicate_count >= 90:
+                critical_issues.append("High duplicate count similar to Fund 2 critical issue (98 duplicates)")
+        
+        return AccuracyTestResult(
+            test_id="DUP_AMN_001", 
+            test_name="Duplicate Active Amendments Detection",
+            category="Duplicate Detection",
+            target_accuracy=100.0,
+            actual_accuracy=accuracy_score,
+            variance_amount=duplicate_count,
+            variance_pct=duplicate_rate,
+            status=status,
+            critical_issues=critical_issues,
+            recommendations=[
+                "Remove duplicate active amendments using latest sequence logic",
+                "Implement data validation to prevent duplicate active statuses",
+                "Use MAX(sequence) to select single amendment per property/tenant",
+                "Review amendment status update processes"
+            ] if duplicate_count > 0 else ["No duplicate active amendments found"],
+            detailed_metrics={
+                'total_combinations': total_combinations,
+                'duplicate_count': duplicate_count,
+                'duplicate_rate': duplicate_rate,
+                'accuracy_score': accuracy_score,
+                'sample_duplicates': sample_duplicates
+            },
+            execution_time=0.0,
+            timestamp=None
+        )
     
     def _validate_edge_cases(self) -> List[AccuracyTestResult]:
         """Validate edge case handling"""
@@ -1330,99 +1565,157 @@ class EnhancedAccuracyValidator:
         
         return results
     
+    @_accuracy_test("Edge Case Handling")
     def _test_edge_case_handling(self) -> AccuracyTestResult:
         """Test handling of edge cases in amendments and charges"""
-        start_time = datetime.now()
+        amendments_file = self._paths['amendments']
+        charges_file = self._paths['charges']
+        
+        missing = self._require("Edge Case Handling", [amendments_file, charges_file])
+        if missing:
+            return missing
+        
+        amendments_df = self._load(amendments_file)
+        charges_df = self._load(charges_file)
+        
+        edge_case_analysis = {}
+        
+        # Resolve column availability once; a check whose column is absent is
+        # reported below instead of silently dropping out of the breakdown
+        has_end_date = 'amendment end date' in amendments_df.columns
+        has_amount = 'amount' in charges_df.columns
+        missing_columns = [col for col, present in (('amendment end date', has_end_date), ('amount', has_amount)) if not present]
+        
+        # Keep the total and the issue list current as each check records its count
+        critical_issues = [f"Edge case column missing, check skipped: {col}" for col in missing_columns]
+        total_edge_cases = 0
+        
+        def record(case_type: str, count: int):
+            nonlocal total_edge_cases
+            edge_case_analysis[case_type] = count
+            total_edge_cases += count
+            if count > 0:
+                critical_issues.append(f"{case_type}: {count:,} cases")
+        
+        # Edge Case 1: Null end dates (month-to-month leases)
+        if has_end_date:
+            record('null_end_dates', self._null_count(amendments_df['amendment end date']))
+        
+        # Edge Cases 2-4: zero, negative and very high (>$100k/month) rent amounts,
+        # classified in one pass: 0 = zero, 1 = negative, 2 = extreme, 3 = ok or missing
+        if has_amount:
+            amt = charges_df['amount'].to_numpy(dtype=np.float64, copy=False)
+            code = np.where(amt == 0, 0, np.where(amt < 0, 1, np.where(amt > 100000, 2, 3)))
+            zero_rent, negative_rent, extreme_rent = np.bincount(code, minlength=4)[:3]
+            record('zero_rent_charges', zero_rent)
+            record('negative_rent_charges', negative_rent)
+            record('extreme_rent_charges', extreme_rent)
+        
+        # Edge Case 5: Amendment sequence gaps - a multi-amendment property/tenant
+        # is gap-free only if its sequences are exactly 1..n
+        seq_stats = amendments_df.groupby(['property hmy', 'tenant hmy'], sort=False, observed=True)['amendment sequence'].agg(
+            ['min', 'max', 'nunique', 'count']
+        )
+        has_gap = (
+            (seq_stats['min'] != 1)
+            | (seq_stats['max'] != seq_stats['count'])
+            | (seq_stats['nunique'] != seq_stats['count'])
+        )
+        record('sequence_gaps', int((has_gap & (seq_stats['count'] > 1)).sum()))
         
-        try:
-            amendments_file = f"{self.data_path}/Fund2_Filtered/dim_fp_amendmentsunitspropertytenant_fund2.csv"
-            charges_file = f"{self.data_path}/Fund2_Filtered/dim_fp_amendmentchargeschedule_fund2_active.csv"
-            
-            if not os.path.exists(amendments_file) or not os.path.exists(charges_file):
-                return self._create_file_missing_result("Edge Case Handling", [amendments_file, charges_file])
-            
-            amendments_df = pd.read_csv(amendments_file)
-            charges_df = pd.read_csv(charges_file)
-            
-            edge_case_analysis = {}
-            
-            # Edge Case 1: Null end dates (month-to-month leases)
-            if 'amendment end date' in amendments_df.columns:
-                null_end_dates = amendments_df['amendment end date'].isnull().sum()
-                edge_case_analysis['null_end_dates'] = null_end_dates
-            
-            # Edge Case 2: Zero rent amounts
-            if 'amount' in charges_df.columns:
-                zero_rent = (charges_df['amount'] == 0).sum()
-                edge_case_analysis['zero_rent_charges'] = zero_rent
-            
-            # Edge Case 3: Negative rent amounts 
-            if 'amount' in charges_df.columns:
-                negative_rent = (charges_df['amount'] < 0).sum()
-                edge_case_analysis['negative_rent_charges'] = negative_rent
-            
-            # Edge Case 4: Very high rent amounts (potential errors)
-            if 'amount' in charges_df.columns:
-                extreme_rent = (charges_df['amount'] > 100000).sum()  # >$100k/month
-                edge_case_analysis['extreme_rent_charges'] = extreme_rent
-            
-            # Edge Case 5: Amendment sequence gaps
-            sequence_gaps = 0
-            for (prop_hmy, tenant_hmy), group in amendments_df.groupby(['property hmy', 'tenant hmy']):
-                sequences = sorted(group['amendment sequence'].tolist())
-                if len(sequences) > 1:
-                    expected_sequences = list(range(1, len(sequences) + 1))
-                    if sequences != expected_sequences:
-                        sequence_gaps += 1
-            edge_case_analysis['sequence_gaps'] = sequence_gaps
-            
-            # Calculate overall edge case handling score
-            total_edge_cases = sum(edge_case_analysis.values())
-            total_records = len(amendments_df) + len(charges_df)
-            edge_case_rate = (total_edge_cases / total_records * 100) if total_records > 0 else 0
-            handling_score = max(0, 100 - edge_case_rate)  # Lower edge case rate = better handling
-            
-            status = "PASS" if edge_case_rate <= 5.0 else "WARNING" if edge_case_rate <= 10.0 else "FAIL"
-            
-            critical_issues = []
-            for case_type, count in edge_case_analysis.items():
-                if count > 0:
-                    critical_issues.append(f"{case_type}: {count:,} cases")
-            
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            return AccuracyTestResult(
-                test_id="EDG_CAS_001",
-                test_name="Edge Case Handling Analysis",
-                category="Edge Case Handling",
-                target_accuracy=95.0,
-                actual_accuracy=handling_score,
-                variance_amount=total_edge_cases,
-                variance_pct=edge_case_rate,
-                status=status,
-                critical_issues=critical_issues,
-                recommendations=[
-                    "Handle null end dates as month-to-month leases",
-                    "Review zero and negative rent amounts",
-                    "Validate extreme rent amounts",
-                    "Implement robust sequence gap handling",
-                    "Add edge case validation in DAX measures"
-                ] if edge_case_rate > 5.0 else ["Edge case handling within acceptable range"],
-                detailed_metrics={
-                    'total_records': total_records,
-                    'total_edge_cases': total_edge_cases,
-                    'edge_case_rate': edge_case_rate,
-                    'handling_score': handling_score,
-                    'edge_case_breakdown': edge_case_analysis
-                },
-                execution_time=execution_time,
-                timestamp=start_time
-            )
-            
-        except Exception as e:
-            return self._create_error_result("Edge Case Handling", str(e))
+        # Calculate overall edge case handling score
+        total_records = len(amendments_df) + len(charges_df)
+        edge_case_rate = (total_edge_cases / total_records * 100) if total_records > 0 else 0
+        handling_score = max(0, 100 - edge_case_rate)  # Lower edge case rate = better handling
+        
+        status = "PASS" if edge_case_rate <= 5.0 else "WARNING" if edge_case_rate <= 10.0 else "FAIL"
+        
+        return AccuracyTestResult(
+            test_id="EDG_CAS_001",
+            test_name="Edge Case Handling Analysis",
+            category="Edge Case Handling",
+            target_accuracy=95.0,
+            actual_accuracy=handling_score,
+            variance_amount=total_edge_cases,
+            variance_pct=edge_case_rate,
+            status=status,
+            critical_issues=critical_issues,
+            recommendations=[
+                "Handle null end dates as month-to-month leases",
+                "Review zero and negative rent amounts",
+                "Validate extreme rent amounts",
+                "Implement robust sequence gap handling",
+                "Add edge case validation in DAX measures"
+            ] if edge_case_rate > 5.0 else ["Edge case handling within acceptable range"],
+            detailed_metrics={
+                'total_records': total_records,
+                'total_edge_cases': total_edge_cases,
+                'edge_case_rate': edge_case_rate,
+                'handling_score': handling_score,
+                'edge_case_breakdown': edge_case_analysis,
+                'missing_columns': missing_columns
+            },
+            execution_time=0.0,
+            timestamp=None
+        )
     
     # Helper methods
+    def _count_with_charges(self, amendment_ids: pd.Series, charge_hmy: pd.Index) -> int:
+        """Number of amendment rows whose id has a charge schedule"""
+        ids = pd.Index(amendment_ids)
+        if ids.is_unique:
+            # One hashtable intersection instead of a boolean mask over every row
+            return len(ids.intersection(charge_hmy))
+        return int(ids.isin(charge_hmy).sum())
+    
+    def _count_distinct(self, values: pd.Series) -> int:
+        """Distinct non-null values, matching nunique() without its Series dispatch"""
+        uniques = pd.unique(values.to_numpy())
+        return int(uniques.size - pd.isna(uniques).sum())
+    
+    def _null_count(self, values: pd.Series) -> int:
+        """Missing values in a column, read from the Arrow validity bitmap when Arrow-backed"""
+        if isinstance(values.dtype, pd.ArrowDtype):
+            return int(values.array.__arrow_array__().null_count)
+        return len(values) - int(values.count())
+    
+    def _pair_key(self, df: pd.DataFrame) -> Optional[np.ndarray]:
+        """Property and tenant ids packed into one int64 (property << 32 | tenant), or None if they exceed 31 bits"""
+        # Ids read back as floats (gaps) cannot be packed
+        if not all(pd.api.types.is_integer_dtype(df[col]) for col in ('property hmy', 'tenant hmy')):
+            return None
+        prop = df['property hmy'].to_numpy(dtype=np.int64)
+        tenant = df['tenant hmy'].to_numpy(dtype=np.int64)
+        if len(prop) > 0 and (min(prop.min(), tenant.min()) < 0 or max(prop.max(), tenant.max()) >= 2 ** 31):
+            return None
+        return (prop << 32) | tenant
+    
+    def _status_mask(self, status: pd.Series, statuses: List[str]) -> np.ndarray:
+        """Rows whose status is one of statuses, compared on category codes when the column is categorical"""
+        if isinstance(status.dtype, pd.CategoricalDtype):
+            codes = status.cat.categories.get_indexer(statuses)
+            return np.isin(status.cat.codes.to_numpy(), codes[codes >= 0])
+        return status.isin(statuses).to_numpy()
+    
+    def _require(self, test_name: str, files: List[str]) -> Optional[AccuracyTestResult]:
+        """Return a file-missing result if any input file is absent, else None"""
+        missing = [f for f in files if not self._file_exists(f)]
+        return self._create_file_missing_result(test_name, missing) if missing else None
+    
+    def _file_exists(self, path: str) -> bool:
+        """Whether a file exists, from a per-run listing of its directory (one readdir, not a stat per file)"""
+        directory, name = os.path.split(path)
+        if directory not in self._dir_listings:
+            try:
+                self._dir_listings[directory] = frozenset(os.listdir(directory or '.'))
+            except OSError:
+                self._dir_listings[directory] = frozenset()
+        return name in self._dir_listings[directory]
+    
+    def _n_unique_pairs(self, df: pd.DataFrame, cols: Tuple[str, ...] = ('property hmy', 'tenant hmy')) -> int:
+        """Count distinct key combinations without building a groupby"""
+        return df.loc[:, list(cols)].drop_duplicates().shape[0]
+    
     def _create_error_result(self, test_name: str, error_message: str) -> AccuracyTestResult:
         """Create error result for failed tests"""
         return AccuracyTestResult(
@@ -1435,7 +1728,7 @@ class EnhancedAccuracyValidator:
             variance_pct=100.0,
             status="FAIL",
             critical_issues=[f"Test execution error: {error_message}"],
-            recommendations=["Fix test execution error and retry"],
+            recommendations=list(_ERROR_RECOMMENDATIONS),
             detailed_metrics={'error': error_message, 'traceback': traceback.format_exc()},
             execution_time=0.0,
             timestamp=datetime.now()
@@ -1453,7 +1746,7 @@ class EnhancedAccuracyValidator:
             variance_pct=100.0,
             status="FAIL",
             critical_issues=[f"Missing test data files: {missing_files}"],
-            recommendations=["Ensure all required test data files are available"],
+            recommendations=list(_FILE_MISSING_RECOMMENDATIONS),
             detailed_metrics={'missing_files': missing_files},
             execution_time=0.0,
             timestamp=datetime.now()
@@ -1530,16 +1823,25 @@ class EnhancedAccuracyValidator:
             validation_results['overall_accuracy'] = 0.0
             return validation_results
         
-        # Calculate overall accuracy
-        accuracy_scores = [test.actual_accuracy for test in tests if test.actual_accuracy > 0]
-        overall_accuracy = sum(accuracy_scores) / len(accuracy_scores) if accuracy_scores else 0
+        # Tally statuses, accuracy and resolved Fund 2 issues in one pass over the tests
+        status_counts = Counter()
+        accuracy_total = 0.0
+        accuracy_n = 0
+        critical_issues_resolved = 0
+        for test in tests:
+            status_counts[test.status] += 1
+            if test.actual_accuracy > 0:
+                accuracy_total += test.actual_accuracy
+                accuracy_n += 1
+            if test.status == "PASS" and "Fund 2" in test.test_name:
+                critical_issues_resolved += 1
         
-        # Count critical issues resolved (Fund 2 focus)
-        critical_issues_resolved = sum(1 for test in tests if test.status == "PASS" and "Fund 2" in test.test_name)
+        # Calculate overall accuracy
+        overall_accuracy = accuracy_total / accuracy_n if accuracy_n else 0
         
         # Determine overall status
-        pass_count = len([test for test in tests if test.status == "PASS"])
-        fail_count = len([test for test in tests if test.status == "FAIL"])
+        pass_count = status_counts["PASS"]
+        fail_count = status_counts["FAIL"]
         
         if overall_accuracy >= 95.0 and fail_count == 0:
             overall_status = "PASS"
@@ -1556,7 +1858,7 @@ class EnhancedAccuracyValidator:
                 'total_tests': len(tests),
                 'passed': pass_count,
                 'failed': fail_count,
-                'warnings': len([test for test in tests if test.status == "WARNING"])
+                'warnings': status_counts["WARNING"]
             }
         })
         
@@ -1580,20 +1882,17 @@ class EnhancedAccuracyValidator:
         
         # Specific Fund 2 issue recommendations
         tests = validation_results.get('tests', [])
-        amendment_issues = [test for test in tests if test.category == "Amendment Selection" and test.status == "FAIL"]
-        if amendment_issues:
+        failed_categories = {test.category for test in tests if test.status == "FAIL"}
+        if "Amendment Selection" in failed_categories:
             recommendations.append("🔧 Implement 'latest amendment WITH charges' logic to resolve Fund 2 $232K gap")
         
-        charge_issues = [test for test in tests if test.category == "Charge Integration" and test.status == "FAIL"]
-        if charge_issues:
+        if "Charge Integration" in failed_categories:
             recommendations.append("🔧 Improve charge schedule integration to reach 98%+ target")
         
-        business_rule_issues = [test for test in tests if test.category == "Business Rules" and test.status == "FAIL"]
-        if business_rule_issues:
+        if "Business Rules" in failed_categories:
             recommendations.append("🔧 Implement business rule compliance: exclude 'Proposal in DM' amendments")
         
-        duplicate_issues = [test for test in tests if test.category == "Duplicate Detection" and test.status == "FAIL"]
-        if duplicate_issues:
+        if "Duplicate Detection" in failed_categories:
             recommendations.append("🔧 Remove duplicate active amendments (Fund 2 had 98 duplicates)")
         
         # Performance recommendations
@@ -1607,30 +1906,27 @@ class EnhancedAccuracyValidator:
         try:
             output_file = f"{self.results_path}/enhanced_accuracy_validation_results.json"
             
-            # Convert AccuracyTestResult objects to dictionaries for JSON serialization
-            serializable_results = []
-            for test in validation_results.get('tests', []):
-                test_dict = {
-                    'test_id': test.test_id,
-                    'test_name': test.test_name,
-                    'category': test.category,
-                    'target_accuracy': test.target_accuracy,
-                    'actual_accuracy': test.actual_accuracy,
-                    'variance_amount': test.variance_amount,
-                    'variance_pct': test.variance_pct,
-                    'status': test.status,
-                    'critical_issues': test.critical_issues,
-                    'recommendations': test.recommendations,
-                    'detailed_metrics': test.detailed_metrics,
-                    'execution_time': test.execution_time,
-                    'timestamp': test.timestamp.isoformat()
-                }
-                serializable_results.append(test_dict)
-            
-            validation_results['tests'] = serializable_results
+            # Convert AccuracyTestResult objects to dictionaries for JSON serialization;
+            # fields() gives the declaration order, and unlike asdict() this does not
+            # deep-copy each detailed_metrics payload
+            result_fields = [field.name for field in fields(AccuracyTestResult)]
+            validation_results['tests'] = [
+                {name: getattr(test, name) for name in result_fields}
+                for test in validation_results.get('tests', [])
+            ]
             
-            with open(output_file, 'w') as f:
-                json.dump(validation_results, f, indent=2, default=str)
+            if orjson is not None:
+                # Native numpy scalar support, so counts are written as numbers rather than strings
+                with open(output_file, 'wb') as f:
+                    f.write(orjson.dumps(
+                        validation_results,
+                        default=_json_default,
+                        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+                    ))
+            else:
+                # Write the emoji tags as UTF-8, as orjson does, rather than \uXXXX escapes
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    json.dump(validation_results, f, indent=2, default=_json_default, ensure_ascii=False)
             
             logger.info(f"Validation results saved to: {output_file}")
             
@@ -33,6 +33,8 @@ import json
 import logging
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, date
 from typing import Dict, List, Tuple, Optional, Any, Set
 from dataclasses import dataclass
@@ -48,6 +50,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _sequence_gap_blocks(prop: np.ndarray, tenant: np.ndarray, seq: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Start, size and gap flag of each property/tenant block in arrays sorted by pair, then sequence"""
+    if len(seq) == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty, np.empty(0, dtype=bool)
+    
+    # A block starts wherever the property/tenant pair changes
+    starts = np.flatnonzero(np.r_[True, (prop[1:] != prop[:-1]) | (tenant[1:] != tenant[:-1])])
+    sizes = np.diff(np.r_[starts, len(seq)])
+    
+    # Each block should read 1..n; single-amendment pairs are always in order
+    expected = np.arange(len(seq)) - np.repeat(starts, sizes) + 1
+    has_gap = np.logical_or.reduceat(seq != expected, starts) & (sizes > 1)
+    return starts, sizes, has_gap
+
 @dataclass
 class DataQualityResult:
     """Data structure for data quality test results"""
@@ -80,10 +97,35 @@ class DataValidationRule:
 class DataQualityValidator:
     """Comprehensive data quality validation framework"""
     
+    # Columns the rules read from each Fund 2 extract; one shared list per file keeps one cache entry
+    _AMENDMENT_COLUMNS = [
+        'amendment hmy', 'property hmy', 'tenant hmy', 'amendment sequence', 'amendment status',
+        'amendment start date', 'amendment end date'
+    ]
+    _CHARGE_COLUMNS = ['amendment hmy', 'amount']
+    _PROPERTY_COLUMNS = ['property hmy', 'property code']
+    _TENANT_COLUMNS = ['tenant hmy']
+    _DTYPES = {
+        'amendment hmy': 'int64',
+        'property hmy': 'int64',
+        'tenant hmy': 'int64',
+        'amendment sequence': 'int64',
+        'amendment status': 'category',
+        'amount': 'float64'
+    }
+    _DATE_COLUMNS = ['amendment start date', 'amendment end date']
+    # Yardi extracts write dates as M/D/YYYY; an explicit format skips per-value inference
+    _DATE_FORMAT = '%m/%d/%Y'
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.data_path = config.get('data_path', '/Users/michaeltang/Documents/GitHub/BI/PBI v1.7/Data')
         self.results: List[DataQualityResult] = []
+        self._df_cache: Dict[Tuple[str, float, Tuple[str, ...]], pd.DataFrame] = {}
+        # One lock per cache entry so different files parse concurrently; the short-held
+        # _load_lock only guards creating those per-entry locks
+        self._load_lock = threading.Lock()
+        self._key_locks: Dict[Tuple[str, float, Tuple[str, ...]], threading.Lock] = {}
         
         # Initialize validation rules
         self.validation_rules = self._initialize_validation_rules()
@@ -227,11 +269,17 @@ class DataQualityValidator:
             'recommendations': []
         }
         
-        # Run each validation rule
-        for rule in self.validation_rules:
+        # Rules are independent and share the CSV cache, so run them on a
+        # thread pool and collect results in the original rule order
+        max_workers = min(len(self.validation_rules), os.cpu_count() or 1) or 1
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = []
+            for rule in self.validation_rules:
+                futures.append((rule, executor.submit(self._run_rule, rule)))
+        
+        for rule, future in futures:
             try:
-                logger.info(f"🔍 Running {rule.rule_name}...")
-                result = rule.validation_function(rule)
+                result = future.result()
                 validation_summary['test_results'].append(result)
                 
                 # Count issues by severity
@@ -256,9 +304,13 @@ class DataQualityValidator:
                 validation_summary['test_results'].append(error_result)
                 validation_summary['failed_tests'] += 1
         
-        # Calculate overall quality score
-        quality_scores = [result.quality_score for result in validation_summary['test_results']]
-        validation_summary['overall_quality_score'] = sum(quality_scores) / len(quality_scores) if quality_scores else 0
+        # Calculate overall quality score; rules that failed to execute measured nothing
+        # and stay out of the average (they are still counted as failed tests)
+        quality_scores = np.fromiter(
+            (result.quality_score for result in validation_summary['test_results'] if result.data_source != "ERROR"),
+            dtype=np.float64
+        )
+        validation_summary['overall_quality_score'] = float(quality_scores.mean()) if quality_scores.size else 0.0
         
         # Generate recommendations
         validation_summary['recommendations'] = self._generate_data_quality_recommendations(validation_summary)
@@ -268,6 +320,49 @@ class DataQualityValidator:
         
         return validation_summary
     
+    def _run_rule(self, rule: DataValidationRule) -> DataQualityResult:
+        """Run one validation rule on a pool worker, logging when it actually starts"""
+        logger.info(f"🔍 Running {rule.rule_name}...")
+        return rule.validation_function(rule)
+    
+    def _load_csv(self, path: str, usecols: Optional[List[str]] = None) -> pd.DataFrame:
+        """Read a CSV once per modification time and serve later rules from the cache"""
+        key = (path, os.path.getmtime(path), tuple(usecols or ()))
+        # Rules run concurrently; the per-entry lock keeps a file from being parsed twice
+        with self._load_lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if key not in self._df_cache:
+                self._df_cache[key] = self._read_csv(path, usecols)
+            return self._df_cache[key]
+    
+    def _read_csv(self, path: str, usecols: Optional[List[str]]) -> pd.DataFrame:
+        """Read only the requested columns, with explicit dtypes and parsed dates, via pyarrow when available"""
+        if usecols is None:
+            return pd.read_csv(path)
+        
+        # Columns absent from the file are left for the rules to report
+        header = pd.read_csv(path, nrows=0).columns
+        usecols = [col for col in usecols if col in header]
+        dtypes = {col: dtype for col, dtype in self._DTYPES.items() if col in usecols}
+        date_cols = [col for col in self._DATE_COLUMNS if col in usecols]
+        
+        try:
+            # Arrow's multi-threaded parser; the C engine below is single-threaded
+            return pd.read_csv(path, engine='pyarrow', usecols=usecols, dtype=dtypes,
+                               parse_dates=date_cols, date_format=self._DATE_FORMAT)
+        except (ImportError, ValueError):
+            # No pyarrow, or id/amount columns with gaps or text that cannot take the fixed dtypes
+            categories = {col: dtype for col, dtype in dtypes.items() if dtype == 'category'}
+            return pd.read_csv(path, usecols=usecols, dtype=categories,
+                               parse_dates=date_cols, date_format=self._DATE_FORMAT)
+    
+    @staticmethod
+    def _distinct_and_orphaned(ids: pd.Series, valid_ids: pd.Series) -> Tuple[pd.Index, pd.Index]:
+        """Distinct ids and those absent from valid_ids (an anti-join on the unique values)"""
+        distinct_ids = pd.Index(ids.unique())
+        return distinct_ids, distinct_ids[~distinct_ids.isin(valid_ids)]
+    
     # Amendment Validation Methods
     def _validate_amendment_hmy_uniqueness(self, rule: DataValidationRule) -> DataQualityResult:
         """Validate amendment HMY uniqueness"""
@@ -279,19 +374,18 @@ class DataQualityValidator:
             if not os.path.exists(amendments_file):
                 return self._create_missing_file_result(rule, amendments_file)
             
-            amendments_df = pd.read_csv(amendments_file)
+            amendments_df = self._load_csv(amendments_file, self._AMENDMENT_COLUMNS)
             total_records = len(amendments_df)
             
             # Check for duplicate amendment HMY values
             if 'amendment hmy' in amendments_df.columns:
-                duplicate_hmys = amendments_df['amendment hmy'].duplicated()
-                duplicate_count = duplicate_hmys.sum()
+                hmy_values, hmy_counts = np.unique(amendments_df['amendment hmy'].to_numpy(), return_counts=True)
+                duplicate_count = total_records - len(hmy_values)  # Occurrences beyond the first
                 
                 # Get details of duplicate HMYs
                 if duplicate_count > 0:
-                    duplicate_hmys_list = amendments_df[duplicate_hmys]['amendment hmy'].tolist()
                     issues_detail = [
-                        {'duplicate_hmy': hmy} for hmy in set(duplicate_hmys_list[:10])
+                        {'duplicate_hmy': hmy} for hmy in hmy_values[hmy_counts > 1][:10].tolist()
                     ]
                 else:
                     issues_detail = []
@@ -340,31 +434,30 @@ class DataQualityValidator:
             if not os.path.exists(amendments_file):
                 return self._create_missing_file_result(rule, amendments_file)
             
-            amendments_df = pd.read_csv(amendments_file)
+            amendments_df = self._load_csv(amendments_file, self._AMENDMENT_COLUMNS)
             total_records = len(amendments_df)
             
-            sequence_issues = 0
-            issues_detail = []
+            # Sort once so each property/tenant pair is a contiguous block of ascending sequences
+            prop = amendments_df['property hmy'].to_numpy()
+            tenant = amendments_df['tenant hmy'].to_numpy()
+            seq = amendments_df['amendment sequence'].to_numpy()
+            order = np.lexsort((seq, tenant, prop))
+            prop, tenant, seq = prop[order], tenant[order], seq[order]
             
-            # Check sequence integrity for each property/tenant combination
-            for (prop_hmy, tenant_hmy), group in amendments_df.groupby(['property hmy', 'tenant hmy']):
-                sequences = sorted(group['amendment sequence'].tolist())
-                
-                # Check for gaps in sequence
-                if len(sequences) > 1:
-                    expected_sequences = list(range(1, len(sequences) + 1))
-                    if sequences != expected_sequences:
-                        sequence_issues += len(group)
-                        issues_detail.append({
-                            'property_hmy': prop_hmy,
-                            'tenant_hmy': tenant_hmy,
-                            'actual_sequences': sequences,
-                            'expected_sequences': expected_sequences,
-                            'issue_type': 'sequence_gap'
-                        })
-                        
-                        if len(issues_detail) >= 20:  # Limit detail records
-                            break
+            # Check for gaps in sequence, flagging every row of an affected pair
+            starts, sizes, has_gap = _sequence_gap_blocks(prop, tenant, seq)
+            sequence_issues = int(sizes[has_gap].sum())
+            
+            issues_detail = []
+            for start, size in zip(starts[has_gap][:20], sizes[has_gap][:20]):  # Limit detail records
+                sequences = seq[start:start + size].tolist()
+                issues_detail.append({
+                    'property_hmy': prop[start].item(),
+                    'tenant_hmy': tenant[start].item(),
+                    'actual_sequences': sequences,
+                    'expected_sequences': list(range(1, len(sequences) + 1)),
+                    'issue_type': 'sequence_gap'
+                })
             
             issue_rate = (sequence_issues / total_records * 100) if total_records > 0 else 0
             quality_score = 100 - issue_rate
@@ -407,27 +500,25 @@ class DataQualityValidator:
             if not os.path.exists(amendments_file):
                 return self._create_missing_file_result(rule, amendments_file)
             
-            amendments_df = pd.read_csv(amendments_file)
+            amendments_df = self._load_csv(amendments_file, self._AMENDMENT_COLUMNS)
             total_records = len(amendments_df)
             
             # Define valid amendment statuses
-            valid_statuses = {
+            valid_statuses = pd.CategoricalDtype(categories=[
                 'Activated', 'Superseded', 'Terminated', 'Expired', 
                 'Draft', 'Proposal in DM', 'Cancelled', 'Pending'
-            }
+            ])
             
             if 'amendment status' in amendments_df.columns:
-                # Find invalid statuses
-                invalid_status_mask = ~amendments_df['amendment status'].isin(valid_statuses)
+                # Find invalid statuses (values outside the categories become NaN)
+                invalid_status_mask = amendments_df['amendment status'].astype(valid_statuses).isna()
                 invalid_count = invalid_status_mask.sum()
                 
                 # Get details of invalid statuses
                 if invalid_count > 0:
                     invalid_statuses = amendments_df[invalid_status_mask]['amendment status'].value_counts()
-                    issues_detail = [
-                        {'invalid_status': status, 'count': count} 
-                        for status, count in invalid_statuses.head(10).items()
-                    ]
+                    invalid_statuses = invalid_statuses[invalid_statuses > 0]  # Categorical counts list every category
+                    issues_detail = invalid_statuses.head(10).rename_axis('invalid_status').reset_index(name='count').to_dict('records')
                 else:
                     issues_detail = []
             else:
@@ -475,37 +566,34 @@ class DataQualityValidator:
             if not os.path.exists(amendments_file):
                 return self._create_missing_file_result(rule, amendments_file)
             
-            amendments_df = pd.read_csv(amendments_file)
+            # Shallow copy: the date conversion below must not leak into the cache
+            amendments_df = self._load_csv(amendments_file, self._AMENDMENT_COLUMNS).copy(deep=False)
             total_records = len(amendments_df)
             
-            # Convert date columns
-            date_columns = ['amendment start date', 'amendment end date']
+            # Dates arrive parsed; convert only columns that did not match the extract format
+            date_columns = self._DATE_COLUMNS
             for col in date_columns:
-                if col in amendments_df.columns:
+                if col in amendments_df.columns and not pd.api.types.is_datetime64_any_dtype(amendments_df[col]):
                     amendments_df[col] = pd.to_datetime(amendments_df[col], errors='coerce')
             
             invalid_dates = 0
             issues_detail = []
             
             if all(col in amendments_df.columns for col in date_columns):
-                # Find records where start > end (excluding null end dates)
-                valid_end_dates = amendments_df['amendment end date'].notna()
-                invalid_date_mask = (
-                    amendments_df.loc[valid_end_dates, 'amendment start date'] > 
-                    amendments_df.loc[valid_end_dates, 'amendment end date']
-                )
+                # Find records where start > end (null end dates never compare greater)
+                invalid_date_mask = amendments_df['amendment start date'] > amendments_df['amendment end date']
                 
                 invalid_dates = invalid_date_mask.sum()
                 
                 if invalid_dates > 0:
-                    invalid_records = amendments_df[valid_end_dates][invalid_date_mask]
-                    for _, record in invalid_records.head(10).iterrows():
-                        issues_detail.append({
-                            'amendment_hmy': record.get('amendment hmy', 'Unknown'),
-                            'start_date': record['amendment start date'].isoformat() if pd.notna(record['amendment start date']) else None,
-                            'end_date': record['amendment end date'].isoformat() if pd.notna(record['amendment end date']) else None,
-                            'issue_type': 'start_after_end'
-                        })
+                    # Both dates are set on every flagged row, so the columns format without null checks
+                    invalid_records = amendments_df[invalid_date_mask].head(10)
+                    issues_detail = pd.DataFrame({
+                        'amendment_hmy': invalid_records.get('amendment hmy', 'Unknown'),
+                        'start_date': invalid_records['amendment start date'].dt.strftime('%Y-%m-%dT%H:%M:%S'),
+                        'end_date': invalid_records['amendment end date'].dt.strftime('%Y-%m-%dT%H:%M:%S'),
+                        'issue_type': 'start_after_end'
+                    }).to_dict('records')
             else:
                 # Missing required date columns
                 invalid_dates = total_records
@@ -552,40 +640,43 @@ class DataQualityValidator:
             if not os.path.exists(amendments_file):
                 return self._create_missing_file_result(rule, amendments_file)
             
-            amendments_df = pd.read_csv(amendments_file)
+            amendments_df = self._load_csv(amendments_file, self._AMENDMENT_COLUMNS)
             total_records = len(amendments_df)
             
             # Filter to active amendment statuses
             active_statuses = ['Activated', 'Superseded']
             active_amendments = amendments_df[
                 amendments_df['amendment status'].isin(active_statuses)
-            ].copy()
+            ]
             
             # Group by property/tenant and find duplicates
-            duplicate_groups = active_amendments.groupby(['property hmy', 'tenant hmy']).size()
-            duplicates = duplicate_groups[duplicate_groups > 1]
+            group_keys = ['property hmy', 'tenant hmy']
+            pair_counts = active_amendments.groupby(group_keys).size()
+            duplicates = pair_counts[pair_counts > 1]
             
             duplicate_count = len(duplicates)
             issues_detail = []
             
             if duplicate_count > 0:
-                for (prop_hmy, tenant_hmy), count in duplicates.head(10).items():
-                    duplicate_records = active_amendments[
-                        (active_amendments['property hmy'] == prop_hmy) &
-                        (active_amendments['tenant hmy'] == tenant_hmy)
-                    ]
-                    
-                    issues_detail.append({
-                        'property_hmy': prop_hmy,
-                        'tenant_hmy': tenant_hmy,
-                        'duplicate_count': count,
-                        'amendment_sequences': duplicate_records['amendment sequence'].tolist(),
-                        'amendment_statuses': duplicate_records['amendment status'].tolist(),
-                        'issue_type': 'multiple_active_amendments'
-                    })
+                # Collect sequences and statuses only for the reported pairs
+                # (list aggregation cannot be cast back to the categorical status dtype)
+                sample_pairs = duplicates.head(10)
+                sample_rows = active_amendments[
+                    pd.MultiIndex.from_frame(active_amendments[group_keys]).isin(sample_pairs.index)
+                ].astype({'amendment status': object})
+                issues_detail = sample_rows.groupby(group_keys).agg(
+                    amendment_sequences=('amendment sequence', list),
+                    amendment_statuses=('amendment status', list)
+                ).assign(
+                    duplicate_count=sample_pairs,
+                    issue_type='multiple_active_amendments'
+                ).rename_axis(['property_hmy', 'tenant_hmy']).reset_index()[[
+                    'property_hmy', 'tenant_hmy', 'duplicate_count',
+                    'amendment_sequences', 'amendment_statuses', 'issue_type'
+                ]].to_dict('records')
             
             # Calculate issue rate based on property/tenant combinations
-            total_combinations = len(active_amendments.groupby(['property hmy', 'tenant hmy']))
+            total_combinations = len(pair_counts)
             issue_rate = (duplicate_count / total_combinations * 100) if total_combinations > 0 else 0
             quality_score = 100 - issue_rate
             
@@ -630,39 +721,41 @@ class DataQualityValidator:
             if not os.path.exists(charges_file):
                 return self._create_missing_file_result(rule, charges_file)
             
-            charges_df = pd.read_csv(charges_file)
+            charges_df = self._load_csv(charges_file, self._CHARGE_COLUMNS)
             total_records = len(charges_df)
             
             invalid_amounts = 0
             issues_detail = []
             
             if 'amount' in charges_df.columns:
-                # Check for various charge amount issues
-                negative_amounts = charges_df['amount'] < 0
-                zero_amounts = charges_df['amount'] == 0
-                extreme_amounts = charges_df['amount'] > 100000  # >$100k/month
+                amt = charges_df['amount'].to_numpy(dtype=np.float64, copy=False)
                 
-                invalid_amounts = negative_amounts.sum() + zero_amounts.sum() + extreme_amounts.sum()
+                # Check for various charge amount issues in one pass:
+                # 0 = negative, 1 = zero, 2 = extreme (>$100k/month), 3 = ok or missing
+                code = np.where(amt < 0, 0, np.where(amt == 0, 1, np.where(amt > 100000, 2, 3)))
+                negative_amounts, zero_amounts, extreme_amounts = np.bincount(code, minlength=4)[:3]
+                
+                invalid_amounts = negative_amounts + zero_amounts + extreme_amounts
                 
                 # Collect issue details
-                if negative_amounts.sum() > 0:
+                if negative_amounts > 0:
                     issues_detail.append({
                         'issue_type': 'negative_amounts',
-                        'count': negative_amounts.sum(),
+                        'count': negative_amounts,
                         'severity': 'HIGH'
                     })
                 
-                if zero_amounts.sum() > 0:
+                if zero_amounts > 0:
                     issues_detail.append({
                         'issue_type': 'zero_amounts',
-                        'count': zero_amounts.sum(),
+                        'count': zero_amounts,
                         'severity': 'MEDIUM'
                     })
                 
-                if extreme_amounts.sum() > 0:
+                if extreme_amounts > 0:
                     issues_detail.append({
                         'issue_type': 'extreme_amounts',
-                        'count': extreme_amounts.sum(),
+                        'count': extreme_amounts,
                         'threshold': 100000,
                         'severity': 'HIGH'
                     })
@@ -713,8 +806,8 @@ class DataQualityValidator:
             if not os.path.exists(amendments_file) or not os.path.exists(charges_file):
                 return self._create_missing_file_result(rule, [amendments_file, charges_file])
             
-            amendments_df = pd.read_csv(amendments_file)
-            charges_df = pd.read_csv(charges_file)
+            amendments_df = self._load_csv(amendments_file, self._AMENDMENT_COLUMNS)
+            charges_df = self._load_csv(charges_file, self._CHARGE_COLUMNS)
             
             # Focus on active amendments that should have charges
             active_statuses = ['Activated', 'Superseded']
@@ -724,9 +817,10 @@ class DataQualityValidator:
             
             total_active_amendments = len(active_amendments)
             
-            # Check how many have charge schedules
+            # Check how many have charge schedules, probing the distinct charge ids once built
+            charge_ids = pd.Index(charges_df['amendment hmy'].unique())
             amendments_with_charges = active_amendments[
-                active_amendments['amendment hmy'].isin(charges_df['amendment hmy'])
+                active_amendments['amendment hmy'].isin(charge_ids)
             ]
             
             amendments_with_charges_count = len(amendments_with_charges)
@@ -738,7 +832,7 @@ class DataQualityValidator:
             ]
             
             latest_with_charges = latest_amendments[
-                latest_amendments['amendment hmy'].isin(charges_df['amendment hmy'])
+                latest_amendments['amendment hmy'].isin(charge_ids)
             ]
             
             issue_rate = (missing_charges / total_active_amendments * 100) if total_active_amendments > 0 else 100
@@ -796,16 +890,13 @@ class DataQualityValidator:
             if not os.path.exists(amendments_file) or not os.path.exists(charges_file):
                 return self._create_missing_file_result(rule, [amendments_file, charges_file])
             
-            amendments_df = pd.read_csv(amendments_file)
-            charges_df = pd.read_csv(charges_file)
+            amendments_df = self._load_csv(amendments_file, self._AMENDMENT_COLUMNS)
+            charges_df = self._load_csv(charges_file, self._CHARGE_COLUMNS)
             
             total_charges = len(charges_df)
             
             # Check for orphaned charges (charges without corresponding amendments)
-            charge_amendment_ids = set(charges_df['amendment hmy'].astype(str))
-            valid_amendment_ids = set(amendments_df['amendment hmy'].astype(str))
-            
-            orphaned_charges = charge_amendment_ids - valid_amendment_ids
+            _, orphaned_charges = self._distinct_and_orphaned(charges_df['amendment hmy'], amendments_df['amendment hmy'])
             orphaned_count = len(orphaned_charges)
             
             issue_rate = (orphaned_count / total_charges * 100) if total_charges > 0 else 0
@@ -818,7 +909,7 @@ class DataQualityValidator:
                 issues_detail.append({
                     'issue_type': 'orphaned_charges',
                     'orphaned_count': orphaned_count,
-                    'sample_orphaned_ids': list(orphaned_charges)[:10]
+                    'sample_orphaned_ids': orphaned_charges[:10].astype(str).tolist()
                 })
             
             execution_time = (datetime.now() - start_time).total_seconds()
@@ -859,16 +950,15 @@ class DataQualityValidator:
             if not os.path.exists(amendments_file) or not os.path.exists(properties_file):
                 return self._create_missing_file_result(rule, [amendments_file, properties_file])
             
-            amendments_df = pd.read_csv(amendments_file)
-            properties_df = pd.read_csv(properties_file)
+            amendments_df = self._load_csv(amendments_file, self._AMENDMENT_COLUMNS)
+            properties_df = self._load_csv(properties_file, self._PROPERTY_COLUMNS)
             
             total_amendments = len(amendments_df)
             
             # Check for orphaned property references
-            amendment_properties = set(amendments_df['property hmy'].astype(str))
-            valid_properties = set(properties_df['property hmy'].astype(str))
-            
-            orphaned_properties = amendment_properties - valid_properties
+            amendment_properties, orphaned_properties = self._distinct_and_orphaned(
+                amendments_df['property hmy'], properties_df['property hmy']
+            )
             orphaned_count = len(orphaned_properties)
             
             issue_rate = (orphaned_count / len(amendment_properties) * 100) if len(amendment_properties) > 0 else 0
@@ -881,7 +971,7 @@ class DataQualityValidator:
                 issues_detail.append({
                     'issue_type': 'orphaned_property_references',
                     'orphaned_count': orphaned_count,
-                    'sample_orphaned_properties': list(orphaned_properties)[:10]
+                    'sample_orphaned_properties': orphaned_properties[:10].astype(str).tolist()
                 })
             
             execution_time = (datetime.now() - start_time).total_seconds()
@@ -921,16 +1011,15 @@ class DataQualityValidator:
             if not os.path.exists(amendments_file) or not os.path.exists(tenants_file):
                 return self._create_missing_file_result(rule, [amendments_file, tenants_file])
             
-            amendments_df = pd.read_csv(amendments_file)
-            tenants_df = pd.read_csv(tenants_file)
+            amendments_df = self._load_csv(amendments_file, self._AMENDMENT_COLUMNS)
+            tenants_df = self._load_csv(tenants_file, self._TENANT_COLUMNS)
             
             total_amendments = len(amendments_df)
             
             # Check for orphaned tenant references
-            amendment_tenants = set(amendments_df['tenant hmy'].astype(str))
-            valid_tenants = set(tenants_df['tenant hmy'].astype(str))
-            
-            orphaned_tenants = amendment_tenants - valid_tenants
+            amendment_tenants, orphaned_tenants = self._distinct_and_orphaned(
+                amendments_df['tenant hmy'], tenants_df['tenant hmy']
+            )
             orphaned_count = len(orphaned_tenants)
             
             issue_rate = (orphaned_count / len(amendment_tenants) * 100) if len(amendment_tenants) > 0 else 0
@@ -943,7 +1032,7 @@ class DataQualityValidator:
                 issues_detail.append({
                     'issue_type': 'orphaned_tenant_references',
                     'orphaned_count': orphaned_count,
-                    'sample_orphaned_tenants': list(orphaned_tenants)[:10]
+                    'sample_orphaned_tenants': orphaned_tenants[:10].astype(str).tolist()
                 })
             
             execution_time = (datetime.now() - start_time).total_seconds()
@@ -983,7 +1072,7 @@ class DataQualityValidator:
             if not os.path.exists(amendments_file):
                 return self._create_missing_file_result(rule, amendments_file)
             
-            amendments_df = pd.read_csv(amendments_file)
+            amendments_df = self._load_csv(amendments_file, self._AMENDMENT_COLUMNS)
             total_records = len(amendments_df)
             
             # Define required fields
@@ -1059,7 +1148,7 @@ class DataQualityValidator:
             if not os.path.exists(properties_file):
                 return self._create_missing_file_result(rule, properties_file)
             
-            properties_df = pd.read_csv(properties_file)
+            properties_df = self._load_csv(properties_file, self._PROPERTY_COLUMNS)
             total_properties = len(properties_df)
             
             invalid_codes = 0